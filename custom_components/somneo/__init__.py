@@ -4,21 +4,58 @@ from __future__ import annotations
 import asyncio
 import functools as ft
 import logging
-from datetime import time, timedelta
+import random
+from collections.abc import Awaitable, Callable
+from datetime import datetime, time, timedelta
+from time import monotonic
+from typing import Any
 
+import aiohttp
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.debounce import Debouncer
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from pysomneo import Somneo
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+from pysomneo import DAYS_TYPE
+from pysomneo.util import days_int_to_list
 
-from .const import CONF_SESSION, DOMAIN
+from .api import SomneoApi, days_to_int
+from .const import (
+    CONF_CONCURRENCY,
+    CONF_MAX_INTERVAL,
+    CONF_MIN_INTERVAL,
+    CONF_SESSION,
+    CUSTOM,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_MAX_INTERVAL,
+    DEFAULT_MIN_INTERVAL,
+    DOMAIN,
+    PW_DELTA,
+    SECTION_ALARMS,
+    SECTION_LIGHT,
+    SECTION_PLAYER,
+    SECTION_SENSORS,
+    SECTION_SNOOZE,
+    SECTION_STATUS,
+    SECTION_SUNSET,
+)
+from .schedule import AlarmSchedule
+from .scheduler import PRIORITY_COMMAND, PRIORITY_POLL, RequestScheduler
+from .services import async_setup_services
+from .stats import SomneoStats
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = [
     Platform.BUTTON,
+    Platform.CALENDAR,
     Platform.LIGHT,
     Platform.MEDIA_PLAYER,
     Platform.NUMBER,
@@ -28,18 +65,92 @@ PLATFORMS = [
     Platform.TEXT,
     Platform.TIME,
 ]
-SCAN_INTERVAL = timedelta(seconds=10)
+# The poll interval adapts to the device activity: the minimum interval is
+# used while an alarm or sunset is running and the interval ramps down from the
+# maximum (idle) interval towards the minimum when the next alarm approaches.
+ACTIVE_STATUSES = ("wake-up", "snooze", "sunset")
+ALARM_RAMP = timedelta(hours=1)
+# Failed polls are retried with an exponential, jittered backoff starting at
+# the maximum interval. After a few failures the circuit opens: polls only
+# probe the status section and writes fail fast until a probe succeeds.
+# The last data is served until it is older than the staleness threshold,
+# after which the entities become unavailable.
+BACKOFF_MAX = timedelta(minutes=10)
+CIRCUIT_THRESHOLD = 3
+STALE_AFTER = timedelta(minutes=3)
+# The statistics change on every request, their sensors are updated at most
+# once per interval (seconds). A new failure is shown right away.
+STATS_UPDATE_INTERVAL = 60
+# Refresh tiers of the device state. Sections without an interval are read on
+# every poll, the others on the first poll after their interval elapsed.
+# Writes read back the sections they touch, which restarts their interval.
+# The due sections of a poll are read concurrently, bounded by the
+# concurrency option since the embedded web server is easily overloaded.
+# The themes are read once, the device info only during the config flow.
+SECTION_INTERVALS: dict[str, timedelta | None] = {
+    SECTION_SENSORS: timedelta(seconds=10),
+    SECTION_STATUS: None,
+    SECTION_LIGHT: None,
+    SECTION_PLAYER: timedelta(minutes=1),
+    SECTION_SUNSET: timedelta(minutes=5),
+    SECTION_ALARMS: timedelta(minutes=5),
+    SECTION_SNOOZE: timedelta(minutes=15),
+}
+# Settings sharing one endpoint that are changed within this window (seconds)
+# are merged into a single write, e.g. a scene setting all sunset options.
+WRITE_COALESCE_WINDOW = 0.25
+# Light transitions are sent as a ramp of brightness levels, at most this many
+# steps per second. Each step reads back the light, so the device is kept busy.
+TRANSITION_RATE = 2
+# The light has 25 brightness levels.
+LIGHT_LEVELS = 25
+# The last complete device state is stored to create the entities from on
+# startup, without waiting for the device. It is written right after the first
+# complete read, then at most once per delay (seconds).
+STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 300
+# Stores of the config entries, by storage key.
+DATA_STORES = f"{DOMAIN}_stores"
+# Settings of a saved configuration, per section of the device state.
+SUNSET_SETTINGS = ("curve", "level", "duration", "sound", "volume")
+
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Somneo services."""
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up the Somneo component."""
     host = entry.data[CONF_HOST]
     use_session = entry.options.get(CONF_SESSION, True)
+    concurrency = entry.options.get(CONF_CONCURRENCY, DEFAULT_CONCURRENCY)
+    min_interval = entry.options.get(CONF_MIN_INTERVAL, DEFAULT_MIN_INTERVAL)
+    max_interval = entry.options.get(CONF_MAX_INTERVAL, DEFAULT_MAX_INTERVAL)
 
-    coordinator = SomneoCoordinator(hass, host, use_session=use_session)
+    coordinator = SomneoCoordinator(
+        hass,
+        host,
+        use_session=use_session,
+        concurrency=concurrency,
+        min_interval=min_interval,
+        max_interval=max_interval,
+        store=_store(hass, _snapshot_key(entry.entry_id)),
+        configurations=_store(hass, _configuration_key(entry.entry_id)),
+    )
     entry.async_on_unload(entry.add_update_listener(update_listener))
 
-    await coordinator.async_config_entry_first_refresh()
+    if await coordinator.async_restore_snapshot():
+        # Read the device in the background, it may well be offline.
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), "somneo first refresh"
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
@@ -54,11 +165,42 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: SomneoCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_flush_snapshot()
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored device state and configurations."""
+    stores = hass.data.get(DATA_STORES, {})
+    for key in (_snapshot_key(entry.entry_id), _configuration_key(entry.entry_id)):
+        store = stores.pop(key, None) or Store(hass, STORAGE_VERSION, key)
+        await store.async_remove()
+
+
+def _store(hass: HomeAssistant, key: str) -> Store[dict[str, Any]]:
+    """Return the store of a storage key.
+
+    A store is created once and shared by all setups of a config entry, so
+    a pending save of an earlier setup can not write a removed store again.
+    """
+    stores: dict[str, Store[dict[str, Any]]] = hass.data.setdefault(DATA_STORES, {})
+    if (store := stores.get(key)) is None:
+        store = stores[key] = Store(hass, STORAGE_VERSION, key)
+    return store
+
+
+def _snapshot_key(entry_id: str) -> str:
+    """Return the storage key of the device state of a config entry."""
+    return f"{DOMAIN}.{entry_id}"
+
+
+def _configuration_key(entry_id: str) -> str:
+    """Return the storage key of the saved configurations of a config entry."""
+    return f"{DOMAIN}.{entry_id}.configurations"
+
+
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -97,188 +239,707 @@ async def async_migrate_entry(hass, config_entry: ConfigEntry):
 class SomneoCoordinator(DataUpdateCoordinator[None]):
     """Representation of a Somneo Coordinator."""
 
-    def __init__(self, hass: HomeAssistant, host: str, use_session : bool = True) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        host: str,
+        use_session: bool = True,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        min_interval: int = DEFAULT_MIN_INTERVAL,
+        max_interval: int = DEFAULT_MAX_INTERVAL,
+        store: Store[dict[str, Any]] | None = None,
+        configurations: Store[dict[str, Any]] | None = None,
+    ) -> None:
         """Initialize Somneo client."""
-        self.somneo = Somneo(host, use_session=use_session)
-        self.state_lock = asyncio.Lock()
+        self.somneo = SomneoApi(
+            async_get_clientsession(hass, verify_ssl=False),
+            host,
+            use_session=use_session,
+            concurrency=concurrency,
+        )
+        self.scheduler = RequestScheduler()
+        self._store = store
+        self._snapshot_saved_at: float | None = None
+        self._configurations = configurations
+        self.schedule = AlarmSchedule()
+        self._next_alarm: datetime | None = None
+        self._unsub_next_alarm: CALLBACK_TYPE | None = None
+        self.stats = SomneoStats()
+        self._dispatched_stats = 0
+        self._dispatched_failures = 0
+        self._stats_dispatched_at = 0.0
+        self._write_buffers: dict[str, dict[str, Any]] = {}
+        self._write_results: dict[str, asyncio.Future[None]] = {}
+        self._pending_commands: dict[
+            str, tuple[Callable[[], Awaitable[None]], list[asyncio.Future[None]]]
+        ] = {}
+        self._command_workers: set[str] = set()
+        self._light_ramp: asyncio.Task[None] | None = None
+        self._dispatched_data: dict[str, Any] | None = None
+        self._dispatched_success = True
+        self._failures = 0
+        self._last_success = 0.0
+        self.min_interval = timedelta(seconds=min_interval)
+        self.max_interval = timedelta(seconds=max(min_interval, max_interval))
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=SCAN_INTERVAL,
+            update_interval=self.max_interval,
             update_method=self._async_update,
             request_refresh_debouncer=Debouncer(
                 hass, _LOGGER, cooldown=1.0, immediate=False
             ),
         )
 
+    async def async_shutdown(self) -> None:
+        """Cancel a running light transition and stop polling."""
+        self._cancel_light_ramp()
+        self._async_track_next_alarm(None)
+        await super().async_shutdown()
+
+    async def async_restore_snapshot(self) -> bool:
+        """Publish the stored device state, return whether there was one."""
+        if self._store is None or not (snapshot := await self._store.async_load()):
+            return False
+        try:
+            data = self.somneo.restore(snapshot)
+        except (KeyError, IndexError, TypeError, ValueError) as err:
+            _LOGGER.warning("Ignoring invalid stored Somneo state: %r", err)
+            return False
+
+        _LOGGER.debug("Restored the stored Somneo state")
+        self.async_set_updated_data(dict(data))
+        return True
+
+    @callback
+    def _async_save_snapshot(self) -> None:
+        """Store the device state once all sections have been read.
+
+        The save is not postponed by later polls, a delayed save that every
+        poll reschedules would only be written when Home Assistant stops.
+        """
+        if self._store is None or (snapshot := self.somneo.snapshot()) is None:
+            return
+        now = monotonic()
+        if (
+            self._snapshot_saved_at is not None
+            and now - self._snapshot_saved_at < SNAPSHOT_SAVE_DELAY
+        ):
+            return
+        self._snapshot_saved_at = now
+        self._store.async_delay_save(lambda: snapshot)
+
+    async def async_flush_snapshot(self) -> None:
+        """Store the latest device state now, replacing a pending save."""
+        if self._store is not None and (snapshot := self.somneo.snapshot()):
+            await self._store.async_save(snapshot)
+
+    async def async_save_configuration(self, name: str) -> None:
+        """Store the settings of the device under a name."""
+        if self._configurations is None:
+            raise HomeAssistantError("Configurations can not be stored")
+        configurations = await self._configurations.async_load() or {}
+        configurations[name] = _configuration(self.data)
+        await self._configurations.async_save(configurations)
+        _LOGGER.debug("Saved Somneo configuration %s", name)
+
+    async def async_restore_configuration(self, name: str) -> None:
+        """Restore stored settings, only writing the settings that differ.
+
+        The settings sharing an endpoint are sent in one write and the
+        endpoints are written concurrently.
+        """
+        configurations = (
+            await self._configurations.async_load() if self._configurations else None
+        )
+        if not configurations or (stored := configurations.get(name)) is None:
+            raise HomeAssistantError(f"Unknown Somneo configuration: {name}")
+        current = _configuration(self.data)
+        writes: list[Awaitable[None]] = []
+
+        alarms: dict[int, dict[str, Any]] = {}
+        for alarm, settings in stored["alarms"].items():
+            if (slot := int(alarm)) not in self.data["alarms"]:
+                continue
+            if changes := _diff(settings, current["alarms"][alarm]):
+                if "time" in changes:
+                    changes["time"] = dt_util.parse_time(changes["time"])
+                alarms[slot] = changes
+        if alarms:
+            writes.append(self.async_set_alarms(alarms))
+        if sunset := _diff(stored["sunset"], current["sunset"]):
+            writes.append(self.async_set_sunset(**sunset))
+        if display := _diff(stored["display"], current["display"]):
+            writes.append(self.async_set_display(**display))
+        if stored["snooze_time"] != current["snooze_time"]:
+            writes.append(self.async_set_snooze_time(stored["snooze_time"]))
+        player = _diff(stored["player"], current["player"])
+        if "volume" in player:
+            writes.append(self.async_set_player_volume(player["volume"]))
+        # Selecting a source starts the player, so only switch while it plays.
+        if (
+            "source" in player
+            and self.data["player"]["state"]
+            and player["source"] in self.data["player"]["possible_sources"]
+        ):
+            writes.append(self.async_set_player_source(player["source"]))
+
+        _LOGGER.debug(
+            "Restoring Somneo configuration %s with %s writes", name, len(writes)
+        )
+        await asyncio.gather(*writes)
+
     async def _async_update(self):
-        """Fetch the latest data."""
-        if self.state_lock.locked():
-            return self.data or {}
-        
+        """Fetch the latest data.
+
+        Polls wait for the device behind running and queued commands, so
+        they always read the state after those writes.
+        """
+        queued = monotonic()
         try:
-            data = await self.hass.async_add_executor_job(self.somneo.fetch_data)
-
-            if data is None:
-                _LOGGER.debug("Somneo fetch returned None, using previous data")
-                return self.data or {}
-            
-            return data
-        
-        except Exception as e:
-            _LOGGER.error("Error fetching data from Somneo: %s", e)
+            async with self.scheduler.async_slot(PRIORITY_POLL):
+                start = monotonic()
+                self.stats.record_poll_wait(start - queued)
+                if self.circuit_open:
+                    # Half-open: probe with a single cheap read before a full poll.
+                    await self.somneo.async_fetch_sections([SECTION_STATUS])
+                    _LOGGER.info("Somneo is reachable again")
+                data = await self.somneo.async_fetch_sections(self._due_sections())
+        except Exception as err:
+            self.stats.record_failure()
+            return self._handle_update_error(err)
+
+        self.stats.record_fetch(monotonic() - start)
+        self._record_success()
+        if data is None:
+            _LOGGER.debug("Somneo fetch returned None, using previous data")
             return self.data or {}
 
+        self._adapt_update_interval(data)
+        self._async_save_snapshot()
+        if self.data and self.scheduler.queued(PRIORITY_COMMAND):
+            # Keep the optimistic state of the queued commands, the first
+            # command publishes the polled data along with its own changes.
+            return self.data
+        return dict(data)
+
+    @property
+    def write_queue(self) -> dict[str, Any]:
+        """Return the writes waiting to be sent to the device."""
+        return {
+            "latest_wins": sorted(self._pending_commands),
+            "running": sorted(self._command_workers),
+            "coalescing": {
+                endpoint: dict(fields)
+                for endpoint, fields in self._write_buffers.items()
+            },
+        }
+
+    @property
+    def circuit_open(self) -> bool:
+        """Return whether the device is considered unreachable."""
+        return self._failures >= CIRCUIT_THRESHOLD
+
+    def _record_success(self) -> None:
+        """Close the circuit after the device answered a poll or a write."""
+        self._failures = 0
+        self._last_success = monotonic()
+
+    def _record_failure(self, err: Exception) -> None:
+        """Back off after a failed poll or write."""
+        self._failures += 1
+        backoff = min(BACKOFF_MAX, self.max_interval * 2 ** (self._failures - 1))
+        self.update_interval = backoff * random.uniform(0.5, 1)
+        if self._failures == CIRCUIT_THRESHOLD:
+            _LOGGER.warning(
+                "Somneo unreachable after %s attempts, backing off: %s",
+                self._failures,
+                err,
+            )
+
+    def _handle_update_error(self, err: Exception) -> dict[str, Any]:
+        """Back off after a failed poll, serving the last data until it is stale."""
+        self._record_failure(err)
+        if self.data and monotonic() - self._last_success < STALE_AFTER.total_seconds():
+            _LOGGER.debug(
+                "Error fetching data from Somneo, retrying in %s: %s",
+                self.update_interval,
+                err,
+            )
+            return self.data
+        # Not the repr, a response error would log all request and response headers.
+        raise UpdateFailed(
+            f"Error fetching data from Somneo: {str(err) or type(err).__name__}"
+        ) from err
+
+    def _ensure_reachable(self) -> None:
+        """Fail fast on writes while the device is unreachable."""
+        if self.circuit_open or not self.last_update_success:
+            raise HomeAssistantError("Somneo is unreachable")
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify the listeners subscribed to the data that changed.
+
+        Listeners register the data keys they depend on as context, alarm
+        entities use ("alarms", slot) and the diagnostic sensors "stats".
+        Listeners without context are always notified, all listeners are
+        notified when the availability changes.
+        """
+        if self.data and "alarms" in self.data:
+            next_alarm = self._async_next_alarm(self.data)
+            if self.data.get("next_alarm", ...) != next_alarm:
+                self.data = {**self.data, "next_alarm": next_alarm}
+            self._async_track_next_alarm(next_alarm)
+
+        data = self.data or {}
+        if (
+            self._dispatched_data is None
+            or self._dispatched_success != self.last_update_success
+        ):
+            changed = None
+        else:
+            changed = _changed_keys(self._dispatched_data, data)
+            if self._stats_due():
+                changed.add("stats")
+            if not changed:
+                return
+        self._dispatched_data = data
+        self._dispatched_success = self.last_update_success
+        if changed is None or "stats" in changed:
+            self._dispatched_stats = self.stats.version
+            self._dispatched_failures = self.stats.failures
+            self._stats_dispatched_at = monotonic()
+
+        for update_callback, context in list(self._listeners.values()):
+            if changed is None or context is None or not changed.isdisjoint(context):
+                update_callback()
+
+    def _stats_due(self) -> bool:
+        """Return whether the statistics sensors need an update."""
+        if self._dispatched_stats == self.stats.version:
+            return False
+        return (
+            self.stats.failures != self._dispatched_failures
+            or monotonic() - self._stats_dispatched_at >= STATS_UPDATE_INTERVAL
+        )
+
+    @callback
+    def async_set_updated_data(self, data: dict[str, Any]) -> None:
+        """Publish data set outside a poll and reschedule the next poll."""
+        self._adapt_update_interval(data)
+        super().async_set_updated_data(data)
+
+    def _adapt_update_interval(self, data: dict[str, Any]) -> None:
+        """Set the poll interval matching the device activity."""
+        if data.get("somneo_status") in ACTIVE_STATUSES or (
+            data.get("sunset") or {}
+        ).get("is_on"):
+            interval = self.min_interval
+        elif (next_alarm := self._async_next_alarm(data)) and (
+            ramp := (next_alarm - dt_util.now()) / ALARM_RAMP
+        ) < 1:
+            interval = self.min_interval + (
+                self.max_interval - self.min_interval
+            ) * max(ramp, 0)
+        else:
+            interval = self.max_interval
+
+        if interval != self.update_interval:
+            _LOGGER.debug("Poll interval changed to %s", interval)
+            self.update_interval = interval
+
+    @callback
+    def _async_next_alarm(self, data: dict[str, Any]) -> datetime | None:
+        """Update the alarm schedule from the data, return the next alarm."""
+        now = dt_util.now()
+        if "alarms" in data:
+            self.schedule.update(data["alarms"], now)
+        occurrence = self.schedule.next_occurrence(now)
+        return occurrence.start if occurrence else None
+
+    @callback
+    def _async_track_next_alarm(self, next_alarm: datetime | None) -> None:
+        """Publish the following alarm once the next alarm went off."""
+        if next_alarm == self._next_alarm:
+            return
+        if self._unsub_next_alarm is not None:
+            self._unsub_next_alarm()
+            self._unsub_next_alarm = None
+        self._next_alarm = next_alarm
+        if next_alarm is not None:
+            self._unsub_next_alarm = async_track_point_in_time(
+                self.hass, self._async_next_alarm_passed, next_alarm
+            )
+
+    @callback
+    def _async_next_alarm_passed(self, _now: datetime) -> None:
+        """Move on to the following alarm."""
+        self._unsub_next_alarm = None
+        self._next_alarm = None
+        self.async_update_listeners()
+
+    def _due_sections(self) -> list[str]:
+        """Return the sections whose refresh tier is due."""
+        now = monotonic()
+        last_fetch = self.somneo.last_fetch
+        return [
+            section
+            for section, interval in SECTION_INTERVALS.items()
+            if interval is None
+            or section not in last_fetch
+            or now - last_fetch[section] >= interval.total_seconds()
+        ]
+
+    @callback
+    def _async_apply_optimistic(self, changes: dict[str, Any]) -> None:
+        """Publish the expected result of a write before the device confirms it."""
+        self._ensure_reachable()
+        if self.data:
+            # Not device data, so the poll schedule and the backoff are kept.
+            self.data = _merge(self.data, changes)
+            self.async_update_listeners()
+
+    async def _async_write(
+        self, write: Callable[..., Awaitable[None]], *args: Any, **kwargs: Any
+    ) -> None:
+        """Perform a device write and publish the state read back afterwards.
+
+        Writes run before queued polls. The client reads back the sections
+        touched by a write, so there is no need for a full refresh. If the
+        write fails, the last known device state is published again to revert
+        any optimistic changes. Writes count towards the circuit breaker like
+        polls do.
+        """
+        self._ensure_reachable()
+        name = getattr(write, "__name__", "write").removeprefix("async_")
+        queued = monotonic()
+        try:
+            async with self.scheduler.async_slot(PRIORITY_COMMAND):
+                start = monotonic()
+                self.stats.record_write_wait(start - queued)
+                await write(*args, **kwargs)
+            self.stats.record_write(name, monotonic() - start)
+        except Exception as err:
+            self.stats.record_failure(write=True)
+            if not isinstance(err, ValueError):
+                # Invalid settings say nothing about the reachability.
+                self._record_failure(err)
+            # Keep the backoff, publishing does not reschedule the next poll.
+            self.data = dict(self.somneo.data)
+            self.async_update_listeners()
+            raise
+
+        self._record_success()
+        if not self.scheduler.queued(PRIORITY_COMMAND):
+            # Queued commands publish the state read back by this one.
+            self.async_set_updated_data(dict(self.somneo.data))
+
+    async def _async_latest_wins(
+        self, key: str, command: Callable[[], Awaitable[None]]
+    ) -> None:
+        """Queue a command, replacing a not yet sent command with the same key.
+
+        Commands for one key run one at a time. While one is being sent, only
+        the most recent of the commands arriving meanwhile is kept; callers of
+        superseded commands wait for the command that replaced theirs.
+        """
+        future = self.hass.loop.create_future()
+        if key in self._pending_commands:
+            _, waiters = self._pending_commands[key]
+            _LOGGER.debug("Dropping superseded %s command", key)
+        else:
+            waiters = []
+        waiters.append(future)
+        self._pending_commands[key] = (command, waiters)
+
+        if key not in self._command_workers:
+            self._command_workers.add(key)
+            self.hass.async_create_task(
+                self._async_run_commands(key), eager_start=False
+            )
+        await asyncio.shield(future)
+
+    async def _async_run_commands(self, key: str) -> None:
+        """Send the queued commands of a key until none is pending."""
+        try:
+            while key in self._pending_commands:
+                command, waiters = self._pending_commands.pop(key)
+                try:
+                    await command()
+                except Exception as err:
+                    for waiter in waiters:
+                        waiter.set_exception(err)
+                else:
+                    for waiter in waiters:
+                        waiter.set_result(None)
+        finally:
+            self._command_workers.discard(key)
+
+    async def _async_coalesced_write(
+        self, endpoint: str, write: Callable[..., Awaitable[None]], **fields: Any
+    ) -> None:
+        """Merge field updates for one endpoint into a single device write.
+
+        The first update opens a window in which later updates to the same
+        endpoint are merged (latest value per field wins). All callers wait
+        for the combined write.
+        """
+        fields = {key: value for key, value in fields.items() if value is not None}
+        if endpoint in self._write_buffers:
+            self._write_buffers[endpoint].update(fields)
+        else:
+            self._write_buffers[endpoint] = fields
+            self._write_results[endpoint] = self.hass.loop.create_future()
+            self.hass.async_create_task(
+                self._async_flush_write(endpoint, write), eager_start=False
+            )
+        await asyncio.shield(self._write_results[endpoint])
+
+    async def _async_flush_write(
+        self, endpoint: str, write: Callable[..., Awaitable[None]]
+    ) -> None:
+        """Send the buffered fields of an endpoint after the coalesce window."""
+        await asyncio.sleep(WRITE_COALESCE_WINDOW)
+        fields = self._write_buffers.pop(endpoint)
+        result = self._write_results.pop(endpoint)
+        _LOGGER.debug("Writing coalesced %s settings: %s", endpoint, fields)
+        try:
+            await self._async_write(write, **fields)
+        except Exception as err:
+            result.set_exception(err)
+        else:
+            result.set_result(None)
+
     async def async_toggle_light(
         self, state: bool, brightness: int | None = None
     ) -> None:
-        """Toggle the main light."""
-        async with self.state_lock:
-            await self.hass.async_add_executor_job(
-                ft.partial(self.somneo.toggle_light, state, brightness=brightness)
-            )
-            await self.async_request_refresh()
+        """Toggle the main light, stopping a running transition."""
+        self._cancel_light_ramp()
+        await self._async_send_light(state, brightness)
+
+    async def async_transition_light(
+        self, state: bool, brightness: int | None = None, transition: float = 0
+    ) -> None:
+        """Fade the main light to a brightness (or off) in the background.
+
+        The ramp is cancelled by the next light command. Levels are derived
+        from the elapsed time, so levels are skipped when the device is slower
+        than the step rate instead of the ramp falling behind.
+        """
+        self._cancel_light_ramp()
+        data = self.data or {}
+        # The reported brightness is truncated, round it back to its level.
+        level = round((data.get("light_brightness") or 0) / 255 * LIGHT_LEVELS)
+        start = level if data.get("light_is_on") else 0
+        if not state:
+            target = 0
+        elif brightness:
+            target = _light_level(brightness)
+        else:
+            target = level or LIGHT_LEVELS
+        steps = min(abs(target - start), int(transition * TRANSITION_RATE))
+        if steps < 2:
+            await self._async_send_light(state, brightness)
+            return
+
+        self._ensure_reachable()
+        _LOGGER.debug(
+            "Fading light from level %s to %s in %s steps", start, target, steps
+        )
+        self._light_ramp = self.hass.async_create_background_task(
+            self._async_ramp_light(start, target, transition / steps, steps, level),
+            "somneo light transition",
+        )
+
+    async def _async_ramp_light(
+        self, start: int, target: int, interval: float, steps: int, restore: int
+    ) -> None:
+        """Send the steps of a light transition."""
+        loop = self.hass.loop
+        begin = loop.time()
+        sent = start or None
+        try:
+            for step in range(1, steps + 1):
+                fraction = min(1, (loop.time() - begin) / (interval * steps))
+                level = max(1, round(start + (target - start) * fraction))
+                if level != sent and step < steps:
+                    await self._async_send_light(True, _light_brightness(level))
+                    sent = level
+                await asyncio.sleep(max(0, begin + step * interval - loop.time()))
+            if target:
+                await self._async_send_light(True, _light_brightness(target))
+            else:
+                # Turn off at the original level, for the next turn on.
+                await self._async_send_light(
+                    False, _light_brightness(restore) if restore else None
+                )
+        except (HomeAssistantError, aiohttp.ClientError, TimeoutError) as err:
+            _LOGGER.warning("Light transition stopped: %r", err)
+        finally:
+            if self._light_ramp is asyncio.current_task():
+                self._light_ramp = None
+
+    @callback
+    def _cancel_light_ramp(self) -> None:
+        """Stop a running light transition."""
+        if self._light_ramp is not None:
+            self._light_ramp.cancel()
+            self._light_ramp = None
+
+    async def _async_send_light(self, state: bool, brightness: int | None) -> None:
+        """Send a light command, only the latest of rapid changes is sent."""
+        changes: dict[str, Any] = {"light_is_on": state, "nightlight_is_on": False}
+        if brightness:
+            changes["light_brightness"] = int(int(brightness / 255 * 25) / 25 * 255)
+        self._async_apply_optimistic(changes)
+        await self._async_latest_wins(
+            "light",
+            ft.partial(
+                self._async_write,
+                self.somneo.async_toggle_light,
+                state,
+                brightness=brightness,
+            ),
+        )
 
     async def async_toggle_nightlight(self, state: bool) -> None:
         """Toggle the night light."""
-        async with self.state_lock:
-            await self.hass.async_add_executor_job(
-                self.somneo.toggle_night_light, state
-            )
-            await self.async_request_refresh()
+        self._cancel_light_ramp()
+        self._async_apply_optimistic(
+            {"light_is_on": False, "nightlight_is_on": state}
+        )
+        await self._async_write(self.somneo.async_toggle_night_light, state)
 
     async def async_toggle_alarm(self, alarm: str, state: bool) -> None:
         """Toggle an alarm."""
-        async with self.state_lock:
-            await self.hass.async_add_executor_job(
-                self.somneo.toggle_alarm, alarm, state
-            )
-            await self.async_request_refresh()
+        self._async_apply_optimistic({"alarms": {alarm: {"enabled": state}}})
+        await self._async_write(self.somneo.async_toggle_alarm, alarm, state)
 
     async def async_dismiss_alarm(self) -> None:
         """Dismiss alarm."""
-        async with self.state_lock:
-            await self.hass.async_add_executor_job(self.somneo.dismiss_alarm)
-            await self.async_request_refresh()
+        await self._async_write(self.somneo.async_dismiss_alarm)
 
     async def async_set_alarm(
         self, alarm: str, alarm_time: time | None = None, days: str | list | None = None
     ):
         """Set alarm time."""
-        async with self.state_lock:
-            await self.hass.async_add_executor_job(
-                ft.partial(self.somneo.set_alarm, alarm, v_time=alarm_time, days=days)
-            )
-            await self.async_request_refresh()
+        changes: dict[str, Any] = {}
+        if alarm_time is not None:
+            changes["time"] = alarm_time
+        if days is not None and (days_int := days_to_int(days)) is not None:
+            changes["days"] = days_int_to_list(days_int)
+            changes["days_type"] = DAYS_TYPE.get(days_int, CUSTOM)
+        self._async_apply_optimistic({"alarms": {alarm: changes}})
+        await self._async_write(
+            self.somneo.async_set_alarm, alarm, v_time=alarm_time, days=days
+        )
+
+    async def async_set_alarms(self, alarms: dict[int, dict[str, Any]]) -> None:
+        """Program several alarms in a single transaction."""
+        changes: dict[int, dict[str, Any]] = {}
+        for alarm, settings in alarms.items():
+            changes[alarm] = {
+                key: settings[key] for key in ("enabled", "time") if key in settings
+            }
+            if (days := settings.get("days")) is not None and (
+                days_int := days_to_int(days)
+            ) is not None:
+                changes[alarm]["days"] = days_int_to_list(days_int)
+                changes[alarm]["days_type"] = DAYS_TYPE.get(days_int, CUSTOM)
+            if (delta := settings.get("powerwake")) is not None:
+                changes[alarm]["powerwake"] = bool(delta)
+                changes[alarm][PW_DELTA] = delta
+        self._async_apply_optimistic({"alarms": changes})
+        await self._async_write(self.somneo.async_set_alarms, alarms)
 
     async def async_toggle_alarm_powerwake(self, alarm: str, state: bool):
         """Toggle powerwake (default 10 minutes)."""
-        async with self.state_lock:
-            await self.hass.async_add_executor_job(
-                ft.partial(
-                    self.somneo.set_alarm_powerwake, alarm, onoff=state, delta=10
-                )
-            )
-            await self.async_request_refresh()
+        self._async_apply_optimistic(
+            {"alarms": {alarm: {"powerwake": state, PW_DELTA: 10 if state else 0}}}
+        )
+        await self._async_write(
+            self.somneo.async_set_alarm_powerwake, alarm, onoff=state, delta=10
+        )
 
     async def async_set_alarm_powerwake(self, alarm: str, delta: int = 0):
         """Set powerwake time."""
-        async with self.state_lock:
-            await self.hass.async_add_executor_job(
-                ft.partial(
-                    self.somneo.set_alarm_powerwake,
-                    alarm,
-                    onoff=bool(delta),
-                    delta=delta,
-                )
-            )
-            await self.async_request_refresh()
+        self._async_apply_optimistic(
+            {"alarms": {alarm: {"powerwake": bool(delta), PW_DELTA: delta}}}
+        )
+        await self._async_write(
+            self.somneo.async_set_alarm_powerwake,
+            alarm,
+            onoff=bool(delta),
+            delta=delta,
+        )
 
     async def async_snooze_alarm(self) -> None:
         """Snooze alarm."""
-        async with self.state_lock:
-            await self.hass.async_add_executor_job(self.somneo.snooze_alarm)
-            await self.async_request_refresh()
+        await self._async_write(self.somneo.async_snooze_alarm)
 
     async def async_set_snooze_time(self, snooze_time):
         """Set snooze time."""
-        async with self.state_lock:
-            await self.hass.async_add_executor_job(
-                self.somneo.set_snooze_time, int(snooze_time)
-            )
-            await self.async_request_refresh()
+        self._async_apply_optimistic({"snooze_time": int(snooze_time)})
+        await self._async_write(self.somneo.async_set_snooze_time, int(snooze_time))
 
     async def async_set_alarm_light(
         self, alarm: str, curve: str = "sunny day", level: int = 20, duration: int = 30
     ):
         """Adjust the light settings of an alarm."""
-        async with self.state_lock:
-            await self.hass.async_add_executor_job(
-                ft.partial(
-                    self.somneo.set_alarm_light,
-                    alarm,
-                    curve=curve,
-                    level=level,
-                    duration=duration,
-                )
-            )
-            await self.async_request_refresh()
+        await self._async_write(
+            self.somneo.async_set_alarm_light,
+            alarm,
+            curve=curve,
+            level=level,
+            duration=duration,
+        )
 
     async def async_set_alarm_sound(
         self, alarm: str, source="wake-up", level=12, channel="forest birds"
     ):
         """Adjust the sound settings of an alarm."""
-        async with self.state_lock:
-            await self.hass.async_add_executor_job(
-                ft.partial(
-                    self.somneo.set_alarm_sound,
-                    alarm,
-                    source=source,
-                    level=level,
-                    channel=channel,
-                )
-            )
-            await self.async_request_refresh()
+        await self._async_write(
+            self.somneo.async_set_alarm_sound,
+            alarm,
+            source=source,
+            level=level,
+            channel=channel,
+        )
 
     async def async_remove_alarm(self, alarm: str):
         """Remove alarm from list in Somneo app."""
-        async with self.state_lock:
-            await self.hass.async_add_executor_job(self.somneo.remove_alarm, alarm)
+        await self._async_write(self.somneo.async_remove_alarm, alarm)
 
     async def async_add_alarm(self, alarm: str):
         """Add alarm to list in Somneo app."""
-        async with self.state_lock:
-            await self.hass.async_add_executor_job(self.somneo.add_alarm, alarm)
+        await self._async_write(self.somneo.async_add_alarm, alarm)
 
     async def async_player_toggle(self, state: bool):
         """Toggle the audio player."""
-        async with self.state_lock:
-            await self.hass.async_add_executor_job(self.somneo.toggle_player, state)
-            await self.async_request_refresh()
+        self._async_apply_optimistic({"player": {"state": state}})
+        await self._async_write(self.somneo.async_toggle_player, state)
 
     async def async_set_player_volume(self, volume: float):
-        """Set the volume of the audio player."""
-        async with self.state_lock:
-            await self.hass.async_add_executor_job(
-                self.somneo.set_player_volume, volume
-            )
-            await self.async_request_refresh()
+        """Set the volume of the audio player, only the latest value is sent."""
+        level = int(min(max(volume, 0), 1) * 24 + 1)
+        self._async_apply_optimistic({"player": {"volume": (level - 1) / 24}})
+        await self._async_latest_wins(
+            "player_volume",
+            ft.partial(self._async_write, self.somneo.async_set_player_volume, volume),
+        )
 
     async def async_set_player_source(self, source: str):
         """Set the volume of the audio player."""
-        async with self.state_lock:
-            await self.hass.async_add_executor_job(
-                self.somneo.set_player_source, source
-            )
-            await self.async_request_refresh()
+        self._async_apply_optimistic({"player": {"source": source, "state": True}})
+        await self._async_write(self.somneo.async_set_player_source, source)
 
     async def async_toggle_sunset(self, state: bool) -> None:
         """Toggle the main light."""
-        async with self.state_lock:
-            await self.hass.async_add_executor_job(self.somneo.toggle_sunset, state)
-            await self.async_request_refresh()
+        self._async_apply_optimistic({"sunset": {"is_on": state}})
+        await self._async_write(self.somneo.async_toggle_sunset, state)
 
     async def async_set_sunset(
         self,
@@ -289,24 +950,105 @@ class SomneoCoordinator(DataUpdateCoordinator[None]):
         volume: int | None = None,
     ):
         """Adjust the sunset settings."""
-        async with self.state_lock:
-            await self.hass.async_add_executor_job(
-                ft.partial(
-                    self.somneo.set_sunset,
-                    curve=curve,
-                    level=level,
-                    duration=duration,
-                    sound=sound,
-                    volume=volume,
-                )
-            )
-            await self.async_request_refresh()
+        changes = {
+            "curve": curve.lower() if curve else None,
+            "level": level,
+            "duration": duration,
+            "sound": sound.lower() if sound else None,
+            "volume": volume,
+        }
+        self._async_apply_optimistic(
+            {"sunset": {key: value for key, value in changes.items() if value}}
+        )
+        await self._async_coalesced_write(
+            "sunset",
+            self.somneo.async_set_sunset,
+            curve=curve,
+            level=level,
+            duration=duration,
+            sound=sound,
+            volume=volume,
+        )
     
     async def async_set_display(
         self, state: bool | None = None, brightness: int | None = None):
         """Adjust the display."""
-        async with self.state_lock:
-            await self.hass.async_add_executor_job(
-                ft.partial(self.somneo.set_display, state=state, brightness=brightness)
-            )
-            await self.async_request_refresh()
+        changes = {"display_always_on": state, "display_brightness": brightness}
+        self._async_apply_optimistic(
+            {key: value for key, value in changes.items() if value is not None}
+        )
+        await self._async_coalesced_write(
+            "display",
+            self.somneo.async_set_display,
+            state=state,
+            brightness=brightness,
+        )
+
+
+def _light_level(brightness: int) -> int:
+    """Return the device level of a brightness (0..255)."""
+    return int(brightness / 255 * LIGHT_LEVELS)
+
+
+def _light_brightness(level: int) -> int:
+    """Return a brightness (0..255) within a device level."""
+    return min(255, round((level + 0.5) * 255 / LIGHT_LEVELS))
+
+
+def _configuration(data: dict[str, Any]) -> dict[str, Any]:
+    """Return the settings in the device state, in a storable form."""
+    return {
+        "alarms": {
+            str(alarm): {
+                "enabled": settings["enabled"],
+                "time": settings["time"].strftime("%H:%M"),
+                "days": list(settings["days"]),
+                "powerwake": settings[PW_DELTA] if settings["powerwake"] else 0,
+            }
+            for alarm, settings in data["alarms"].items()
+        },
+        "sunset": {key: data["sunset"][key] for key in SUNSET_SETTINGS},
+        "display": {
+            "state": data["display_always_on"],
+            "brightness": data["display_brightness"],
+        },
+        "snooze_time": data["snooze_time"],
+        "player": {
+            "volume": data["player"]["volume"],
+            "source": data["player"]["source"],
+        },
+    }
+
+
+def _diff(stored: dict[str, Any], current: dict[str, Any]) -> dict[str, Any]:
+    """Return the stored settings that differ from the current ones."""
+    return {
+        key: value for key, value in stored.items() if current.get(key) != value
+    }
+
+
+def _merge(data: dict, changes: dict) -> dict:
+    """Return a copy of data with the (nested) changes applied."""
+    merged = dict(data)
+    for key, value in changes.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _changed_keys(old: dict, new: dict) -> set[Any]:
+    """Return the data keys whose value differs, including changed alarm slots."""
+    changed: set[Any] = {
+        key for key in old.keys() | new.keys() if old.get(key) != new.get(key)
+    }
+    if "alarms" in changed:
+        old_alarms = old.get("alarms") or {}
+        new_alarms = new.get("alarms") or {}
+        changed.update(
+            ("alarms", alarm)
+            for alarm in old_alarms.keys() | new_alarms.keys()
+            if old_alarms.get(alarm) != new_alarms.get(alarm)
+        )
+    return changed
@@ -0,0 +1,833 @@
+"""Async client for Philips Somneo devices."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid
+import xml.etree.ElementTree as ET
+from collections import deque
+from datetime import datetime, time as dt_time, timedelta
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+from pysomneo import DAYS_TYPE, SOUND_SOURCE_ALARM, STATUS
+from pysomneo.util import (
+    alarms_to_dict,
+    days_list_to_int,
+    player_to_dict,
+    sunset_to_dict,
+)
+
+from .const import (
+    DEFAULT_CONCURRENCY,
+    SECTION_ALARMS,
+    SECTION_LIGHT,
+    SECTION_PLAYER,
+    SECTION_SENSORS,
+    SECTION_SNOOZE,
+    SECTION_STATUS,
+    SECTION_SUNSET,
+)
+from .stats import LatencyHistogram
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+_LOGGER = logging.getLogger(__name__)
+
+BASE_PATH = "/di/v1/products/1/"
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=15, sock_connect=3)
+# Short delay to allow the device to process a write before reading back.
+WRITE_DELAY = 0.1
+# Number of raw responses kept per endpoint for diagnostics.
+PAYLOAD_HISTORY = 5
+
+
+def days_to_int(days: str | list) -> int | None:
+    """Convert a list of days or a days type to the device bitmask."""
+    if isinstance(days, list):
+        return days_list_to_int(days)
+    return next((k for k, v in DAYS_TYPE.items() if v == days), None)
+
+
+class SomneoInvalidURLError(aiohttp.ClientError):
+    """Raised when the Somneo device responds with 422 Invalid URL."""
+
+
+class SomneoApi:
+    """Async representation of the Somneo wake-up light API."""
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        host: str,
+        use_session: bool = True,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> None:
+        """Initialize the client."""
+        self._session = session
+        self._host = host
+        # Without session reuse, ask the device to close every connection.
+        self._headers = None if use_session else {"Connection": "close"}
+        # Bound the number of requests in flight to the device.
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+        self.data: dict[str, Any] = {}
+        # Monotonic time and raw response of the last successful read per section.
+        self.last_fetch: dict[str, float] = {}
+        self.raw_sections: dict[str, Any] = {}
+        # Request durations per endpoint and the last raw responses of reads.
+        self.request_timings: dict[str, LatencyHistogram] = {}
+        self.payloads: dict[str, deque[dict[str, Any]]] = {}
+        self._fetchers = {
+            SECTION_SENSORS: self._async_fetch_sensor_data,
+            SECTION_STATUS: self._async_fetch_alarm_status,
+            SECTION_LIGHT: self._async_fetch_light_data,
+            SECTION_PLAYER: self._async_fetch_player_data,
+            SECTION_SUNSET: self._async_fetch_sunset_data,
+            SECTION_ALARMS: self._async_fetch_alarm_data,
+            SECTION_SNOOZE: self._async_fetch_snooze_time,
+        }
+        self._decoders = {
+            SECTION_SENSORS: self._decode_sensor_data,
+            SECTION_STATUS: self._decode_alarm_status,
+            SECTION_LIGHT: self._decode_light_data,
+            SECTION_PLAYER: self._decode_player_data,
+            SECTION_SUNSET: self._decode_sunset_data,
+            SECTION_ALARMS: self._decode_alarm_data,
+            SECTION_SNOOZE: self._decode_snooze_time,
+        }
+
+        self.alarm_status: dict | None = None
+        self.light_data: dict | None = None
+        self.sunset_data: dict | None = None
+        self.enabled_alarms: dict | None = None
+        self.time_alarms: dict | None = None
+        self.snoozetime: dict | None = None
+        self.player: dict | None = None
+        self.wake_light_themes: dict[str, int] = {}
+        self.dusk_light_themes: dict[str, int] = {}
+        self.wake_sound_themes: dict[str, int] = {}
+        self.dusk_sound_themes: dict[str, int] = {}
+        self.player_sources: list[str] = []
+
+    async def _async_request(
+        self, method: str, url: str, payload: dict[str, Any] | None = None
+    ) -> aiohttp.ClientResponse:
+        """Perform a request, retrying once on a stale keep-alive connection."""
+        for attempt in (1, 2):
+            try:
+                resp = await self._session.request(
+                    method,
+                    url,
+                    json=payload,
+                    headers=self._headers,
+                    ssl=False,
+                    timeout=REQUEST_TIMEOUT,
+                )
+            except aiohttp.ServerDisconnectedError as err:
+                if attempt == 2:
+                    raise
+                _LOGGER.debug("Retrying %s %s after %s", method, url, err)
+            else:
+                if resp.status == 422:
+                    resp.release()
+                    raise SomneoInvalidURLError(f"Invalid URL: {url}")
+                return resp
+        raise aiohttp.ClientError(f"Unable to reach {url}")
+
+    async def _async_call(
+        self, method: str, path: str, payload: dict[str, Any] | None = None
+    ) -> Any:
+        """Call a device endpoint and return the decoded JSON."""
+        async with self._semaphore:
+            start = time.monotonic()
+            resp = await self._async_request(
+                method, f"https://{self._host}{BASE_PATH}{path}", payload
+            )
+            async with resp:
+                resp.raise_for_status()
+                response = await resp.json(content_type=None)
+
+        self.request_timings.setdefault(
+            f"{method} {path}", LatencyHistogram()
+        ).record(time.monotonic() - start)
+        if method == "GET":
+            self.payloads.setdefault(path, deque(maxlen=PAYLOAD_HISTORY)).append(
+                {"time": datetime.now().astimezone().isoformat(), "payload": response}
+            )
+        return response
+
+    async def _async_get(self, path: str) -> Any:
+        """Perform a GET request."""
+        return await self._async_call("GET", path)
+
+    async def _async_put(self, path: str, payload: dict[str, Any]) -> Any:
+        """Perform a PUT request with JSON payload."""
+        _LOGGER.debug("PUT %s payload=%s", path, payload)
+        response = await self._async_call("PUT", path, payload)
+        _LOGGER.debug("PUT %s response=%s", path, response)
+        return response
+
+    async def async_get_device_info(self) -> dict[str, str]:
+        """Get device information, fallback to defaults if unavailable."""
+        device_info = {
+            "manufacturer": "Royal Philips Electronics",
+            "model": "Wake-up Light",
+            "modelnumber": "Unknown",
+            "serial": str(uuid.uuid1()),
+        }
+
+        root = None
+        last_exc: Exception | None = None
+        for scheme in ("https", "http"):
+            url = f"{scheme}://{self._host}/upnp/description.xml"
+            try:
+                async with self._semaphore:
+                    resp = await self._async_request("GET", url)
+                    async with resp:
+                        resp.raise_for_status()
+                        root = ET.fromstring(await resp.read())
+                break
+            except (aiohttp.ClientError, TimeoutError, ET.ParseError) as err:
+                _LOGGER.debug("Fetching %s failed: %s", url, err)
+                last_exc = err
+
+        if root is None:
+            if last_exc is not None:
+                raise last_exc
+            return device_info
+
+        try:
+            device_info["manufacturer"] = root[1][2].text
+            device_info["model"] = root[1][3].text
+            device_info["modelnumber"] = root[1][4].text
+            device_info["serial"] = root[1][6].text
+        except (IndexError, AttributeError) as err:
+            _LOGGER.warning(
+                "Failed to parse XML elements, using default device info: %s", err
+            )
+
+        _LOGGER.debug("Device info: %s", device_info)
+        return device_info
+
+    async def _async_fetch_themes(self) -> None:
+        """Get available light and sound themes."""
+        wake_light, dusk_light, wake_sound, dusk_sound = await asyncio.gather(
+            self._async_get("files/lightthemes"),
+            self._async_get("files/dusklightthemes"),
+            self._async_get("files/wakeup"),
+            self._async_get("files/winddowndusk"),
+        )
+        self.wake_light_themes = {
+            item["name"].lower(): idx
+            for idx, item in enumerate(wake_light.values())
+            if item["name"]
+        }
+        self.dusk_light_themes = {
+            item["name"].lower(): idx for idx, item in enumerate(dusk_light.values())
+        }
+        self.wake_sound_themes = {
+            item["name"].lower(): idx + 1
+            for idx, item in enumerate(wake_sound.values())
+            if item["name"]
+        }
+        self.dusk_sound_themes = {
+            item["name"].lower(): idx + 1
+            for idx, item in enumerate(dusk_sound.values())
+            if item["name"]
+        }
+
+    async def _async_ensure_themes(self) -> None:
+        """Fetch the themes once, they are needed to decode sunset and player data."""
+        if not self.dusk_light_themes or not self.dusk_sound_themes:
+            await self._async_fetch_themes()
+
+    async def async_fetch_sections(self, sections: Iterable[str]) -> dict:
+        """Retrieve the given sections of the device state concurrently."""
+        _LOGGER.debug("Fetching sections %s", sections)
+        await self._async_ensure_themes()
+        results = await asyncio.gather(
+            *(self._fetchers[section]() for section in sections),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        return self.data
+
+    def _fetched(self, section: str, raw: Any) -> None:
+        """Decode the raw response of a section read."""
+        self._decoders[section](raw)
+        self.raw_sections[section] = raw
+        self.last_fetch[section] = time.monotonic()
+
+    def snapshot(self) -> dict[str, Any] | None:
+        """Return the raw device state, None if not all sections were read."""
+        if self.raw_sections.keys() < self._decoders.keys():
+            return None
+        return {
+            "themes": {
+                "wake_light": self.wake_light_themes,
+                "dusk_light": self.dusk_light_themes,
+                "wake_sound": self.wake_sound_themes,
+                "dusk_sound": self.dusk_sound_themes,
+            },
+            "sections": dict(self.raw_sections),
+        }
+
+    def restore(self, snapshot: dict[str, Any]) -> dict:
+        """Decode the device state of a snapshot.
+
+        Only the decoded data and the themes are restored. The raw state
+        writes are based on and the read times are not, so writes and the
+        next poll read the device first.
+        """
+        themes = snapshot["themes"]
+        self.wake_light_themes = themes["wake_light"]
+        self.dusk_light_themes = themes["dusk_light"]
+        self.wake_sound_themes = themes["wake_sound"]
+        self.dusk_sound_themes = themes["dusk_sound"]
+        for section, decode in self._decoders.items():
+            decode(snapshot["sections"][section])
+        return self.data
+
+    async def _async_fetch_sensor_data(self) -> None:
+        """Fetch only the sensor data."""
+        sensor_data = await self._async_get("wusrd")
+        _LOGGER.debug("Fetched sensor data: %s", sensor_data)
+        self._fetched(SECTION_SENSORS, sensor_data)
+
+    def _decode_sensor_data(self, sensor_data: dict) -> None:
+        """Decode the sensor data."""
+        self.data["temperature"] = sensor_data.get("mstmp")
+        self.data["humidity"] = sensor_data.get("msrhu")
+        self.data["luminance"] = sensor_data.get("mslux")
+        self.data["noise"] = sensor_data.get("mssnd")
+
+    async def _async_fetch_light_data(self) -> None:
+        """Fetch only the light data."""
+        self.light_data = await self._async_get("wulgt")
+        _LOGGER.debug("Fetched light data: %s", self.light_data)
+        self._fetched(SECTION_LIGHT, self.light_data)
+
+    def _decode_light_data(self, light_data: dict) -> None:
+        """Decode the light data."""
+        self.data["light_is_on"] = bool(light_data["onoff"])
+        self.data["light_brightness"] = int(int(light_data["ltlvl"]) / 25 * 255)
+        self.data["nightlight_is_on"] = bool(light_data["ngtlt"])
+
+    async def _async_fetch_alarm_status(self) -> None:
+        """Fetch only the alarm status."""
+        self.alarm_status = await self._async_get("wusts")
+        _LOGGER.debug("Fetched alarm status: %s", self.alarm_status)
+        self._fetched(SECTION_STATUS, self.alarm_status)
+
+    def _decode_alarm_status(self, alarm_status: dict) -> None:
+        """Decode the alarm status."""
+        self.data["somneo_status"] = STATUS.get(alarm_status["wusts"], "unknown")
+        self.data["display_always_on"] = bool(alarm_status["dspon"])
+        self.data["display_brightness"] = int(alarm_status["brght"])
+
+    async def _async_fetch_sunset_data(self) -> None:
+        """Fetch only the sunset data."""
+        self.sunset_data = await self._async_get("wudsk")
+        _LOGGER.debug("Fetched sunset data: %s", self.sunset_data)
+        self._fetched(SECTION_SUNSET, self.sunset_data)
+
+    def _decode_sunset_data(self, sunset_data: dict) -> None:
+        """Decode the sunset data."""
+        self.data["sunset"] = sunset_to_dict(
+            sunset_data, self.dusk_light_themes, self.dusk_sound_themes
+        )
+
+    async def _async_fetch_alarm_data(self) -> None:
+        """Fetch only the alarm data."""
+        self.enabled_alarms, self.time_alarms = await asyncio.gather(
+            self._async_get("wualm/aenvs"), self._async_get("wualm/aalms")
+        )
+        _LOGGER.debug("Fetched enabled alarms: %s", self.enabled_alarms)
+        _LOGGER.debug("Fetched time alarms: %s", self.time_alarms)
+        self._fetched(SECTION_ALARMS, [self.enabled_alarms, self.time_alarms])
+
+    def _decode_alarm_data(self, alarm_data: list[dict]) -> None:
+        """Decode the enabled alarms and the alarm times."""
+        enabled_alarms, time_alarms = alarm_data
+        alarms = alarms_to_dict(enabled_alarms, time_alarms)
+        for alarm, listed in enumerate(enabled_alarms.get("prfvs", [])):
+            alarms[alarm]["listed"] = bool(listed)
+        self.data["alarms"] = alarms
+
+    async def _async_fetch_snooze_time(self) -> None:
+        """Fetch only the snooze time."""
+        self.snoozetime = await self._async_get("wualm")
+        _LOGGER.debug("Fetched snooze time: %s", self.snoozetime)
+        self._fetched(SECTION_SNOOZE, self.snoozetime)
+
+    def _decode_snooze_time(self, snoozetime: dict) -> None:
+        """Decode the snooze time."""
+        self.data["snooze_time"] = snoozetime["snztm"]
+
+    async def _async_fetch_player_data(self) -> None:
+        """Fetch only the player data."""
+        self.player = await self._async_get("wuply")
+        _LOGGER.debug("Fetched player status: %s", self.player)
+        self._fetched(SECTION_PLAYER, self.player)
+
+    def _decode_player_data(self, player_data: dict) -> None:
+        """Decode the player data."""
+        player = player_to_dict(player_data, self.dusk_sound_themes)
+        # The sources only change with the themes, keep sharing one list.
+        if player["possible_sources"] == self.player_sources:
+            player["possible_sources"] = self.player_sources
+        else:
+            self.player_sources = player["possible_sources"]
+        self.data["player"] = player
+
+    async def _async_ensure_alarm_data(self) -> None:
+        """Make sure the alarm tables are known before writing to them."""
+        if not self.enabled_alarms or not self.time_alarms:
+            await self._async_fetch_alarm_data()
+
+    async def _async_modify_light(self, payload: dict[str, Any]) -> None:
+        """Set light data."""
+        # Some Wake-up lights don't work with wucrv, remove key if exists
+        payload.pop("wucrv", None)
+        await self._async_put("wulgt", payload)
+
+    async def async_toggle_light(self, state: bool, brightness: int | None = None):
+        """Toggle the light on or off."""
+        if not self.light_data:
+            await self._async_fetch_light_data()
+
+        payload = dict(self.light_data)
+        payload["onoff"] = state
+        payload["ngtlt"] = False
+        if brightness:
+            payload["ltlvl"] = int(brightness / 255 * 25)
+
+        await self._async_modify_light(payload)
+        await asyncio.sleep(WRITE_DELAY)
+        # The response of the put command is incomplete, so read back
+        await self._async_fetch_light_data()
+        await self._async_fetch_sensor_data()
+
+    async def async_toggle_night_light(self, state: bool) -> None:
+        """Toggle the night light on or off."""
+        if not self.light_data:
+            await self._async_fetch_light_data()
+
+        payload = dict(self.light_data)
+        payload["onoff"] = False
+        payload["ngtlt"] = state
+
+        await self._async_modify_light(payload)
+        await asyncio.sleep(WRITE_DELAY)
+        await self._async_fetch_light_data()
+        await self._async_fetch_sensor_data()
+
+    async def async_dismiss_alarm(self) -> None:
+        """Dismiss a running alarm."""
+        await self._async_put("wualm/alctr", {"disms": True})
+        await asyncio.sleep(WRITE_DELAY)
+        await self._async_fetch_alarm_data()
+        await self._async_fetch_alarm_status()
+
+    async def async_snooze_alarm(self) -> None:
+        """Snooze a running alarm."""
+        await self._async_put("wualm/alctr", {"tapsz": True})
+        await asyncio.sleep(WRITE_DELAY)
+        await self._async_fetch_alarm_data()
+        await self._async_fetch_snooze_time()
+        await self._async_fetch_alarm_status()
+
+    async def async_toggle_alarm(self, alarm: int, status: bool) -> None:
+        """Toggle the alarm on or off."""
+        await self._async_ensure_alarm_data()
+
+        payload = {
+            "prfnr": self.data["alarms"][alarm]["position"],
+            "prfvs": True,
+            "prfen": status,
+        }
+        await self._async_put("wualm/prfwu", payload)
+        await asyncio.sleep(WRITE_DELAY)
+        await self._async_fetch_alarm_data()
+
+    async def async_set_alarm(
+        self,
+        alarm: int,
+        v_time: dt_time | None = None,
+        days: str | list | None = None,
+    ) -> None:
+        """Set the time and day of an alarm."""
+        await self._async_ensure_alarm_data()
+
+        current = self.data["alarms"][alarm]
+        alarm_time = current["time"]
+        payload: dict[str, Any] = {"prfnr": current["position"]}
+        if v_time is not None:
+            payload["almhr"] = v_time.hour
+            payload["almmn"] = v_time.minute
+            alarm_time = v_time
+        if days is not None:
+            days_int = days_to_int(days)
+            if days_int is None:
+                days_int = int(self.time_alarms["daynm"][alarm])
+            payload["daynm"] = days_int
+
+        if current["powerwake"]:
+            pw_dt = datetime.combine(datetime.min, alarm_time) + timedelta(
+                minutes=current["powerwake_delta"]
+            )
+            payload["pszhr"] = pw_dt.hour
+            payload["pszmn"] = pw_dt.minute
+
+        await self._async_put("wualm/prfwu", payload)
+        await asyncio.sleep(WRITE_DELAY)
+        await self._async_fetch_alarm_data()
+
+    async def async_set_alarms(self, alarms: dict[int, dict[str, Any]]) -> None:
+        """Program several alarms, with a single write per changed alarm.
+
+        All settings are checked before the first write. Settings that equal
+        the current ones are left out, the alarm table is read back once after
+        all writes.
+        """
+        await self._async_ensure_alarm_data()
+        if not self.wake_light_themes or not self.wake_sound_themes:
+            await self._async_fetch_themes()
+
+        payloads = []
+        for alarm, settings in alarms.items():
+            current = self.data["alarms"][alarm]
+            payload: dict[str, Any] = {}
+            if settings.get("enabled") not in (None, current["enabled"]):
+                payload["prfen"] = settings["enabled"]
+                if settings["enabled"]:
+                    payload["prfvs"] = True
+            alarm_time = settings.get("time", current["time"])
+            if alarm_time != current["time"]:
+                payload["almhr"] = alarm_time.hour
+                payload["almmn"] = alarm_time.minute
+            if (days := settings.get("days")) is not None:
+                days_int = days_to_int(days)
+                if days_int is not None and days_int != int(
+                    self.time_alarms["daynm"][alarm]
+                ):
+                    payload["daynm"] = days_int
+
+            delta = settings.get("powerwake")
+            if delta is None and current["powerwake"] and "almhr" in payload:
+                # Keep the powerwake at the same delay after the new time.
+                delta = current["powerwake_delta"]
+            if delta is not None and (
+                "almhr" in payload
+                or bool(delta) != current["powerwake"]
+                or delta != current["powerwake_delta"]
+            ):
+                pw_dt = datetime.combine(datetime.min, alarm_time) + timedelta(
+                    minutes=delta
+                )
+                payload["pwrsz"] = 1 if delta else 0
+                payload["pszhr"] = pw_dt.hour if delta else 0
+                payload["pszmn"] = pw_dt.minute if delta else 0
+
+            if (curve := settings.get("curve")) is not None:
+                if curve not in self.wake_light_themes:
+                    raise ValueError(f"Unsupported light curve: {curve}")
+                payload["ctype"] = self.wake_light_themes[curve]
+            if (level := settings.get("level")) is not None:
+                payload["curve"] = level
+            if (duration := settings.get("duration")) is not None:
+                payload["durat"] = duration
+            if (source := settings.get("source")) is not None:
+                channel = settings.get("channel", "forest birds")
+                if source == "wake-up" and channel not in self.wake_sound_themes:
+                    raise ValueError(f"Unsupported alarm sound: {channel}")
+                payload["snddv"] = SOUND_SOURCE_ALARM[source]
+                payload["sndch"] = (
+                    self.wake_sound_themes[channel]
+                    if source == "wake-up"
+                    else (" " if source == "off" else channel)
+                )
+            if (volume := settings.get("volume")) is not None:
+                payload["sndlv"] = volume
+
+            if payload:
+                payloads.append({"prfnr": current["position"], **payload})
+
+        _LOGGER.debug("Programming %s of %s alarms", len(payloads), len(alarms))
+        if not payloads:
+            return
+        for payload in payloads:
+            await self._async_put("wualm/prfwu", payload)
+        await asyncio.sleep(WRITE_DELAY)
+        await self._async_fetch_alarm_data()
+
+    async def async_set_alarm_light(
+        self,
+        alarm: int,
+        curve: str = "sunny day",
+        level: int = 20,
+        duration: int = 30,
+    ) -> None:
+        """Adjust the light curve of the wake-up light."""
+        await self._async_ensure_alarm_data()
+        if not self.wake_light_themes:
+            await self._async_fetch_themes()
+
+        payload = {
+            "prfnr": self.data["alarms"][alarm]["position"],
+            "ctype": self.wake_light_themes[curve],
+            "curve": level,
+            "durat": duration,
+        }
+        await self._async_put("wualm/prfwu", payload)
+        await asyncio.sleep(WRITE_DELAY)
+        await self._async_fetch_alarm_data()
+        await self._async_fetch_light_data()
+        await self._async_fetch_sensor_data()
+
+    async def async_set_alarm_sound(
+        self,
+        alarm: int,
+        source: str = "wake-up",
+        channel: str = "forest birds",
+        level: int = 12,
+    ) -> None:
+        """Adjust the alarm sound of the wake-up light."""
+        await self._async_ensure_alarm_data()
+        if not self.wake_sound_themes:
+            await self._async_fetch_themes()
+
+        payload = {
+            "prfnr": self.data["alarms"][alarm]["position"],
+            "snddv": SOUND_SOURCE_ALARM[source],
+            "sndch": (
+                self.wake_sound_themes[channel]
+                if source == "wake-up"
+                else (" " if source == "off" else channel)
+            ),
+            "sndlv": level,
+        }
+        await self._async_put("wualm/prfwu", payload)
+        await asyncio.sleep(WRITE_DELAY)
+        await self._async_fetch_alarm_data()
+        await self._async_fetch_player_data()
+        await self._async_fetch_sensor_data()
+
+    async def async_set_alarm_powerwake(
+        self, alarm: int, onoff: bool = False, delta: int = 0
+    ) -> None:
+        """Set power wake."""
+        await self._async_ensure_alarm_data()
+
+        pw_dt = datetime.combine(
+            datetime.min, self.data["alarms"][alarm]["time"]
+        ) + timedelta(minutes=delta)
+        payload = {
+            "prfnr": self.data["alarms"][alarm]["position"],
+            "pwrsz": 1 if onoff else 0,
+            "pszhr": pw_dt.hour if onoff else 0,
+            "pszmn": pw_dt.minute if onoff else 0,
+        }
+        await self._async_put("wualm/prfwu", payload)
+        await asyncio.sleep(WRITE_DELAY)
+        await self._async_fetch_alarm_data()
+
+    async def async_set_snooze_time(self, snooze_time: int = 9) -> None:
+        """Adjust the snooze time (minutes) of all alarms."""
+        await self._async_put("wualm", {"snztm": snooze_time})
+        await asyncio.sleep(WRITE_DELAY)
+        await self._async_fetch_snooze_time()
+
+    async def async_add_alarm(self, alarm: int) -> None:
+        """Add alarm to the list."""
+        await self._async_ensure_alarm_data()
+
+        payload = {"prfnr": self.data["alarms"][alarm]["position"], "prfvs": True}
+        await self._async_put("wualm/prfwu", payload)
+        await asyncio.sleep(WRITE_DELAY)
+        await self._async_fetch_alarm_data()
+
+    async def async_remove_alarm(self, alarm: int) -> None:
+        """Remove alarm from the list and reset it to the defaults."""
+        await self._async_ensure_alarm_data()
+
+        payload = {
+            "prfnr": self.data["alarms"][alarm]["position"],
+            "prfen": False,
+            "prfvs": False,
+            "almhr": 7,
+            "almmn": 30,
+            "pwrsz": 0,
+            "pszhr": 0,
+            "pszmn": 0,
+            "ctype": 0,
+            "curve": 20,
+            "durat": 30,
+            "daynm": 254,
+            "snddv": "wus",
+            "sndch": "1",
+            "sndlv": 12,
+        }
+        await self._async_put("wualm/prfwu", payload)
+        await asyncio.sleep(WRITE_DELAY)
+        await self._async_fetch_alarm_data()
+
+    async def async_toggle_sunset(self, status: bool) -> None:
+        """Toggle the sunset feature on or off."""
+        await self._async_put("wudsk", {"onoff": status})
+        await asyncio.sleep(WRITE_DELAY)
+        await self._async_ensure_themes()
+        await self._async_fetch_sunset_data()
+        await self._async_fetch_player_data()
+        await self._async_fetch_alarm_status()
+        await self._async_fetch_sensor_data()
+
+    async def async_set_sunset(
+        self,
+        curve: str | None = None,
+        level: int | None = None,
+        duration: int | None = None,
+        sound: str | None = None,
+        volume: int | None = None,
+    ) -> None:
+        """Adjust the sunset settings."""
+        await self._async_ensure_themes()
+        if not self.sunset_data:
+            await self._async_fetch_sunset_data()
+
+        payload = dict(self.sunset_data)
+        if duration:
+            payload["durat"] = duration
+        if curve:
+            payload["ctype"] = self.dusk_light_themes[curve.lower()]
+        if level:
+            payload["curve"] = level
+        if sound:
+            if sound == "off":
+                payload["snddv"] = "off"
+            elif sound.upper().startswith("FM"):
+                payload["snddv"] = "fmr"
+                payload["sndch"] = sound[3:]
+            elif sound.lower() in self.dusk_sound_themes:
+                payload["snddv"] = "dus"
+                payload["sndch"] = self.dusk_sound_themes[sound.lower()]
+            else:
+                raise ValueError(f"Unsupported sunset sound: {sound}")
+        if volume:
+            payload["sndlv"] = volume
+
+        if bool(payload["onoff"]):
+            _LOGGER.debug(
+                "Sunset is already on, to modify it we need to turn it off "
+                "first otherwise changes are ignored"
+            )
+            await self.async_toggle_sunset(False)
+            await asyncio.sleep(1)
+
+        await self._async_put("wudsk", payload)
+        await asyncio.sleep(WRITE_DELAY)
+        await self._async_fetch_sunset_data()
+        await self._async_fetch_player_data()
+        await self._async_fetch_alarm_status()
+        await self._async_fetch_sensor_data()
+
+    async def async_toggle_player(self, state: bool) -> None:
+        """Toggle the audio player."""
+        if not self.player:
+            await self._async_fetch_player_data()
+
+        payload = dict(self.player)
+        payload["onoff"] = state
+
+        await self._async_put("wuply", payload)
+        await asyncio.sleep(WRITE_DELAY)
+        await self._async_ensure_themes()
+        await self._async_fetch_player_data()
+        # It might also affect the sunset state
+        await self._async_fetch_sunset_data()
+        await self._async_fetch_alarm_status()
+        await self._async_fetch_sensor_data()
+
+    async def async_set_player_volume(self, volume: float) -> None:
+        """Set the volume of the player (0..1)."""
+        volume = min(max(volume, 0), 1)
+
+        await self._async_put("wuply", {"sdvol": int(volume * 24 + 1)})
+        await asyncio.sleep(WRITE_DELAY)
+        await self._async_fetch_player_data()
+        await self._async_fetch_sensor_data()
+
+    async def async_set_player_source(self, source: str | int) -> None:
+        """Set the source of the player: aux, a FM preset or a dusk sound theme."""
+        await self._async_ensure_themes()
+        if not self.player:
+            await self._async_fetch_player_data()
+        if not self.sunset_data:
+            await self._async_fetch_sunset_data()
+
+        # Support legacy int sources (1..5 = FM presets)
+        if isinstance(source, int):
+            if source not in range(1, 6):
+                raise ValueError(f"Unsupported player source: {source}")
+            source = f"FM {source}"
+
+        previous_sndch = self.player["sndch"]
+        sunset_on = bool(self.sunset_data["onoff"])
+
+        if source.upper() == "AUX":
+            snddv, sndch = "aux", "1"
+        elif source.upper().startswith("FM "):
+            snddv, sndch = "fmr", source.split(" ")[1]
+        elif source.lower() in self.dusk_sound_themes:
+            snddv, sndch = "dus", self.dusk_sound_themes[source.lower()]
+        else:
+            raise ValueError(f"Unsupported player source: {source}")
+
+        payload = {
+            "snddv": snddv,
+            "sndch": sndch,
+            "sndss": 0,
+            "onoff": True,
+            "tempy": False,
+        }
+        await self._async_put("wuply", payload)
+
+        if sunset_on and previous_sndch != sndch:
+            _LOGGER.debug(
+                "Sunset is already on and we modified the sound, "
+                "to apply these we need to modify sunset endpoint"
+            )
+            await self.async_set_sunset(sound=source)
+
+        await asyncio.sleep(WRITE_DELAY)
+        await self._async_fetch_player_data()
+        # It might also affect the sunset state
+        await self._async_fetch_sunset_data()
+        await self._async_fetch_alarm_status()
+        await self._async_fetch_sensor_data()
+
+    async def async_set_display(
+        self, state: bool | None = None, brightness: int | None = None
+    ) -> None:
+        """Adjust the display."""
+        if not self.alarm_status:
+            await self._async_fetch_alarm_status()
+
+        payload = {
+            "dspon": state if state is not None else self.data["display_always_on"],
+            "brght": (
+                brightness
+                if brightness is not None
+                else self.data["display_brightness"]
+            ),
+        }
+        await self._async_put("wusts", payload)
+        await asyncio.sleep(WRITE_DELAY)
+        await self._async_fetch_alarm_status()
+        await self._async_fetch_sensor_data()
@@ -37,7 +37,7 @@ async def async_setup_entry(
 class SomneoDismiss(SomneoEntity, ButtonEntity):
     """Dismiss alarm button."""
 
-    _attr_should_poll = True
+    _data_keys = frozenset()
     _attr_translation_key = "alarm_dismiss"
 
     async def async_press(self) -> None:
@@ -48,7 +48,7 @@ class SomneoDismiss(SomneoEntity, ButtonEntity):
 class SomneoSnooze(SomneoEntity, ButtonEntity):
     """Snooze alarm button."""
 
-    _attr_should_poll = True
+    _data_keys = frozenset()
     _attr_translation_key = "alarm_snooze"
 
     async def async_press(self) -> None:
@@ -0,0 +1,91 @@
+"""Calendar entity for Somneo."""
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_NAME
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .entity import SomneoEntity
+from .schedule import AlarmOccurrence
+
+_LOGGER = logging.getLogger(__name__)
+
+# An alarm event lasts until the powerwake, or this long without powerwake.
+EVENT_DURATION = timedelta(minutes=10)
+# Longest alarm event, the powerwake is at most 59 minutes after the alarm.
+MAX_EVENT_DURATION = timedelta(minutes=59)
+# Period searched for the next event.
+EVENT_LOOKAHEAD = timedelta(days=8)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Add Somneo calendar from config_entry."""
+
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    unique_id = config_entry.unique_id
+    assert unique_id is not None
+    name = config_entry.data[CONF_NAME]
+    device_info = config_entry.data["dev_info"]
+
+    async_add_entities(
+        [SomneoAlarmCalendar(coordinator, unique_id, name, device_info, "calendar")]
+    )
+
+
+def _event(occurrence: AlarmOccurrence) -> CalendarEvent:
+    """Return the calendar event of an alarm occurrence."""
+    if occurrence.powerwake is not None:
+        end = occurrence.powerwake
+        description = f"PowerWake at {occurrence.powerwake:%H:%M}"
+    else:
+        end = occurrence.start + EVENT_DURATION
+        description = None
+    return CalendarEvent(
+        start=occurrence.start,
+        end=end,
+        summary=f"Alarm {occurrence.alarm}",
+        description=description,
+        uid=f"alarm{occurrence.alarm}_{occurrence.start.isoformat()}",
+    )
+
+
+class SomneoAlarmCalendar(SomneoEntity, CalendarEntity):
+    """Calendar of the alarms, generated from the local alarm schedule."""
+
+    _data_keys = frozenset({"alarms", "next_alarm"})
+    _attr_translation_key = "alarms"
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the current or next alarm."""
+        now = dt_util.now()
+        for occurrence in self.coordinator.schedule.upcoming(
+            now - MAX_EVENT_DURATION, now + EVENT_LOOKAHEAD
+        ):
+            if (event := _event(occurrence)).end > now:
+                return event
+        return None
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        """Return the alarms in a time range."""
+        return [
+            event
+            for occurrence in self.coordinator.schedule.upcoming(
+                dt_util.as_local(start_date) - MAX_EVENT_DURATION,
+                dt_util.as_local(end_date),
+            )
+            if (event := _event(occurrence)).end > start_date
+        ]
@@ -14,15 +14,35 @@ from homeassistant.helpers.service_info.ssdp import SsdpServiceInfo
 from homeassistant.const import CONF_HOST, CONF_NAME
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
-from pysomneo import Somneo
-
-from .const import CONF_SESSION, DEFAULT_NAME, DOMAIN
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .api import SomneoApi
+from .const import (
+    CONF_ALARMS_IN_USE,
+    CONF_CONCURRENCY,
+    CONF_MAX_INTERVAL,
+    CONF_MAX_REPORT_INTERVAL,
+    CONF_MIN_INTERVAL,
+    CONF_MIN_REPORT_INTERVAL,
+    CONF_SESSION,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_MAX_INTERVAL,
+    DEFAULT_MAX_REPORT_INTERVAL,
+    DEFAULT_MIN_INTERVAL,
+    DEFAULT_MIN_REPORT_INTERVAL,
+    DEFAULT_NAME,
+    DOMAIN,
+    SENSOR_DEADBANDS,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
 def host_valid(host) -> bool:
-    """Return True if hostname or IP address is valid."""
+    """Return True if hostname or IP address, with optional port, is valid."""
+    host, _, port = host.partition(":")
+    if port and not (port.isdigit() and 0 < int(port) < 65536):
+        return False
     with suppress(ValueError):
         if ipaddress.ip_address(host).version == 4:
             return True
@@ -60,10 +80,11 @@ class SomneoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def get_device_info(self):
         """Get device info."""
-        somneo = Somneo(self.host)
-        dev_info = await self.hass.async_add_executor_job(somneo.get_device_info)
+        somneo = SomneoApi(
+            async_get_clientsession(self.hass, verify_ssl=False), self.host
+        )
 
-        return dev_info
+        return await somneo.async_get_device_info()
 
     async def async_step_ssdp(self, discovery_info: SsdpServiceInfo) -> FlowResult:
         """Prepare configuration for a discovered Somneo."""
@@ -160,6 +181,51 @@ class SomneoOptionsFlow(config_entries.OptionsFlow):
                         CONF_SESSION,
                         default=self.config_entry.options.get(CONF_SESSION, True)
                     ): bool,
+                    vol.Optional(
+                        CONF_CONCURRENCY,
+                        default=self.config_entry.options.get(
+                            CONF_CONCURRENCY, DEFAULT_CONCURRENCY
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=4)),
+                    vol.Optional(
+                        CONF_MIN_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_MIN_INTERVAL, DEFAULT_MIN_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=10)),
+                    vol.Optional(
+                        CONF_MAX_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_MAX_INTERVAL, DEFAULT_MAX_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=10, max=300)),
+                    vol.Optional(
+                        CONF_MIN_REPORT_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_MIN_REPORT_INTERVAL, DEFAULT_MIN_REPORT_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=600)),
+                    vol.Optional(
+                        CONF_MAX_REPORT_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_MAX_REPORT_INTERVAL, DEFAULT_MAX_REPORT_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=60, max=3600)),
+                    vol.Optional(
+                        CONF_ALARMS_IN_USE,
+                        default=self.config_entry.options.get(
+                            CONF_ALARMS_IN_USE, False
+                        ),
+                    ): bool,
+                    **{
+                        vol.Optional(
+                            f"{sensor}_deadband",
+                            default=self.config_entry.options.get(
+                                f"{sensor}_deadband", deadband
+                            ),
+                        ): vol.All(vol.Coerce(float), vol.Range(min=0))
+                        for sensor, (deadband, _) in SENSOR_DEADBANDS.items()
+                    },
                 }
             )
         )
@@ -14,6 +14,18 @@ DEFAULT_NAME: Final = "Somneo"
 
 CONF_SENS: Final = "sensors"
 CONF_SESSION: Final = "session"
+CONF_CONCURRENCY: Final = "concurrency"
+CONF_MIN_INTERVAL: Final = "min_interval"
+CONF_MAX_INTERVAL: Final = "max_interval"
+CONF_MIN_REPORT_INTERVAL: Final = "min_report_interval"
+CONF_MAX_REPORT_INTERVAL: Final = "max_report_interval"
+CONF_ALARMS_IN_USE: Final = "alarms_in_use"
+
+DEFAULT_CONCURRENCY: Final = 2
+DEFAULT_MIN_INTERVAL: Final = 2
+DEFAULT_MAX_INTERVAL: Final = 30
+DEFAULT_MIN_REPORT_INTERVAL: Final = 30
+DEFAULT_MAX_REPORT_INTERVAL: Final = 900
 
 ALARM: Final = "alarm"
 PW: Final = "powerwake"
@@ -27,6 +39,14 @@ EVERYDAY: Final = "daily"
 CUSTOM: Final = "custom"
 PW_DELTA: Final = "powerwake_delta"
 
+SECTION_SENSORS: Final = "sensors"
+SECTION_STATUS: Final = "status"
+SECTION_LIGHT: Final = "light"
+SECTION_PLAYER: Final = "player"
+SECTION_SUNSET: Final = "sunset"
+SECTION_ALARMS: Final = "alarms"
+SECTION_SNOOZE: Final = "snooze"
+
 ATTR_ALARM: Final = "alarm"
 ATTR_CURVE: Final = "curve"
 ATTR_LEVEL: Final = "level"
@@ -41,5 +61,14 @@ SENSORS: Final = {
     "noise": UnitOfSoundPressure.DECIBEL,
 }
 
+# Default deadband of the sensors (option "<sensor>_deadband") and whether it
+# is relative (% of the reported value) instead of absolute (sensor unit).
+SENSOR_DEADBANDS: Final = {
+    "temperature": (0.2, False),
+    "humidity": (1.0, False),
+    "luminance": (10.0, True),
+    "noise": (3.0, False),
+}
+
 NOTIFICATION_ID: Final = "somneosensor_notification"
 NOTIFICATION_TITLE: Final = "SomneoSensor Setup"
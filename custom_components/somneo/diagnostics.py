@@ -0,0 +1,56 @@
+"""Diagnostics support for Somneo."""
+from __future__ import annotations
+
+from collections import Counter
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from .const import DOMAIN
+
+TO_REDACT = {CONF_HOST, "serial"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    somneo = coordinator.somneo
+    entities = er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": str(coordinator.update_interval),
+            "circuit_open": coordinator.circuit_open,
+            "scheduler": {
+                "busy": coordinator.scheduler.busy,
+                "queued": coordinator.scheduler.queued(),
+            },
+            "write_queue": coordinator.write_queue,
+            "stats": coordinator.stats.summary(),
+        },
+        "requests": {
+            endpoint: timing.summary()
+            for endpoint, timing in sorted(somneo.request_timings.items())
+        },
+        "payloads": {
+            endpoint: list(history)
+            for endpoint, history in sorted(somneo.payloads.items())
+        },
+        "data": coordinator.data,
+        "entities": {
+            "total": len(entities),
+            "enabled": sum(not entity.disabled for entity in entities),
+            "per_platform": dict(Counter(entity.domain for entity in entities)),
+        },
+    }
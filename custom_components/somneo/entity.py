@@ -1,15 +1,124 @@
 """A entity class for Somneo integration."""
-from homeassistant.helpers.entity import DeviceInfo
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_platform, entity_registry as er
+from homeassistant.helpers.entity import DeviceInfo, EntityDescription
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import SomneoCoordinator
-from .const import DOMAIN
+from .const import CONF_ALARMS_IN_USE, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, kw_only=True)
+class SomneoEntityDescription(EntityDescription):
+    """Description of an entity showing a value of the coordinator data."""
+
+    # Key path of the value, relative to the settings of the slot for alarms.
+    value_path: tuple[str, ...] = ()
+    # Keys next to the value that are shown as state attributes.
+    attributes: tuple[str, ...] = ()
+    # The identifier of an alarm entity is alarm<number> followed by this.
+    alarm_suffix: str = ""
+
+
+def data_accessor(path: tuple[Any, ...]) -> Callable[[dict[str, Any]], Any]:
+    """Return a function looking up a key path in the coordinator data."""
+    if len(path) == 1:
+        return itemgetter(path[0])
+    if len(path) == 2:
+        first, second = path
+        return lambda data: data[first][second]
+    if len(path) == 3:
+        first, second, third = path
+        return lambda data: data[first][second][third]
+
+    def _lookup(data: dict[str, Any]) -> Any:
+        for key in path:
+            data = data[key]
+        return data
+
+    return _lookup
+
+
+@callback
+def async_add_alarm_entities(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+    create: Callable[[int], list["SomneoEntity"]],
+) -> None:
+    """Add the entities of the alarm slots.
+
+    With the alarms in use option only the slots that are enabled or listed
+    in the app get entities, plus the first free slot to set up a new alarm.
+    Entities are added and removed from the registry as the slots change.
+    """
+    coordinator: SomneoCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    alarms = coordinator.data["alarms"]
+    if not config_entry.options.get(CONF_ALARMS_IN_USE, False):
+        async_add_entities(
+            [entity for alarm in alarms for entity in create(alarm)],
+            update_before_add=True,
+        )
+        return
+
+    domain = entity_platform.async_get_current_platform().domain
+    registry = er.async_get(hass)
+    added: dict[int, list[str]] = {}
+
+    @callback
+    def _async_remove(unique_ids: list[str]) -> None:
+        for unique_id in unique_ids:
+            if entity_id := registry.async_get_entity_id(domain, DOMAIN, unique_id):
+                registry.async_remove(entity_id)
+
+    @callback
+    def _async_update_slots() -> None:
+        alarms = coordinator.data["alarms"]
+        in_use = {
+            alarm
+            for alarm, settings in alarms.items()
+            if settings["enabled"] or settings.get("listed")
+        }
+        free = next((alarm for alarm in sorted(alarms) if alarm not in in_use), None)
+        if free is not None:
+            in_use.add(free)
+        new = []
+        for alarm in sorted(in_use - added.keys()):
+            entities = create(alarm)
+            added[alarm] = [entity.unique_id for entity in entities]
+            new.extend(entities)
+        if new:
+            async_add_entities(new)
+        for alarm in added.keys() - in_use:
+            _LOGGER.debug("Removing the entities of unused alarm %s", alarm)
+            _async_remove(added.pop(alarm))
+
+    _async_update_slots()
+    # Remove the entities of unused slots created before the option was set.
+    for alarm in alarms.keys() - added.keys():
+        _async_remove([entity.unique_id for entity in create(alarm)])
+    config_entry.async_on_unload(
+        coordinator.async_add_listener(_async_update_slots, frozenset({"alarms"}))
+    )
 
 
 class SomneoEntity(CoordinatorEntity[SomneoCoordinator]):
     """Somneo entity class."""
 
     _attr_has_entity_name = True
+    _rendered_state: tuple[Any, ...] | None = None
+    # Keys of the coordinator data the entity depends on, None for all data.
+    _data_keys: frozenset[Any] | None = None
 
     def __init__(
         self,
@@ -20,7 +129,7 @@ class SomneoEntity(CoordinatorEntity[SomneoCoordinator]):
         identifier: str,
     ) -> None:
         """Initialize the entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=self._data_keys)
 
         self._attr_unique_id = unique_id + "_" + identifier
         self._attr_device_info = DeviceInfo(
@@ -30,3 +139,78 @@ class SomneoEntity(CoordinatorEntity[SomneoCoordinator]):
             name=name,
         )
         self._attr_has_entity_name = True
+
+    async def async_added_to_hass(self) -> None:
+        """Set the initial attributes when added to hass."""
+        await super().async_added_to_hass()
+        if self.coordinator.data:
+            self._update_attrs()
+
+    @callback
+    def _update_attrs(self) -> None:
+        """Update the entity attributes from the coordinator data."""
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update the attributes and write the state only if it changed."""
+        if not self.coordinator.data:
+            _LOGGER.debug("No data received from coordinator, skipping update.")
+            return
+
+        self._update_attrs()
+        rendered = (
+            self.available,
+            self.state,
+            self.capability_attributes,
+            self.state_attributes,
+            self.extra_state_attributes,
+        )
+        if rendered == self._rendered_state:
+            return
+        self._rendered_state = rendered
+        self.async_write_ha_state()
+
+
+class SomneoDescribedEntity(SomneoEntity):
+    """Entity whose value is looked up by the key path of its description.
+
+    The key path is resolved into an accessor once, so an update is a direct
+    lookup. Alarm entities look up the path in the settings of their slot.
+    """
+
+    entity_description: SomneoEntityDescription
+
+    def __init__(
+        self,
+        coordinator: SomneoCoordinator,
+        unique_id: str,
+        name: str,
+        dev_info: dict,
+        description: SomneoEntityDescription,
+        alarm: int | None = None,
+    ) -> None:
+        """Initialize the entity."""
+        path = description.value_path
+        if alarm is None:
+            identifier = description.key
+            self._data_keys = frozenset({path[0]})
+        else:
+            path = ("alarms", alarm, *path)
+            identifier = f"alarm{alarm}{description.alarm_suffix}"
+            self._data_keys = frozenset({("alarms", alarm)})
+            self._attr_translation_placeholders = {"number": str(alarm)}
+        super().__init__(coordinator, unique_id, name, dev_info, identifier)
+
+        self.entity_description = description
+        self._alarm = alarm
+        self._value = data_accessor(path)
+        self._parent = data_accessor(path[:-1]) if description.attributes else None
+
+    @callback
+    def _update_attrs(self) -> None:
+        """Update the attributes shown next to the value."""
+        if self._parent is not None:
+            settings = self._parent(self.coordinator.data)
+            self._attr_extra_state_attributes = {
+                key: settings[key] for key in self.entity_description.attributes
+            }
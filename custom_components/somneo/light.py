@@ -4,7 +4,13 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from homeassistant.components.light import ATTR_BRIGHTNESS, ColorMode, LightEntity
+from homeassistant.components.light import (
+    ATTR_BRIGHTNESS,
+    ATTR_TRANSITION,
+    ColorMode,
+    LightEntity,
+    LightEntityFeature,
+)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant, callback
@@ -41,8 +47,9 @@ async def async_setup_entry(
 class SomneoLight(SomneoEntity, LightEntity):
     """Representation of an Somneo Light."""
 
-    _attr_should_poll = True
+    _data_keys = frozenset({"light_is_on", "light_brightness"})
     _attr_supported_color_modes: set[ColorMode | str] = {ColorMode.BRIGHTNESS}
+    _attr_supported_features = LightEntityFeature.TRANSITION
     _attr_translation_key = "normal_light"
 
     @property
@@ -51,30 +58,35 @@ class SomneoLight(SomneoEntity, LightEntity):
         return ColorMode.BRIGHTNESS
 
     @callback
-    def _handle_coordinator_update(self) -> None:
-        if not self.coordinator.data:
-            _LOGGER.debug("No data received from coordinator, skipping update.")
-            return
-        
+    def _update_attrs(self) -> None:
         self._attr_is_on = self.coordinator.data.get("light_is_on", False)
         self._attr_brightness = self.coordinator.data.get("light_brightness",0)
-        self.async_write_ha_state()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Instruct the light to turn on."""
-        await self.coordinator.async_toggle_light(
-            True, brightness=kwargs.get(ATTR_BRIGHTNESS)
-        )
+        if transition := kwargs.get(ATTR_TRANSITION):
+            await self.coordinator.async_transition_light(
+                True, brightness=kwargs.get(ATTR_BRIGHTNESS), transition=transition
+            )
+        else:
+            await self.coordinator.async_toggle_light(
+                True, brightness=kwargs.get(ATTR_BRIGHTNESS)
+            )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Instruct the light to turn off."""
-        await self.coordinator.async_toggle_light(False)
+        if transition := kwargs.get(ATTR_TRANSITION):
+            await self.coordinator.async_transition_light(
+                False, transition=transition
+            )
+        else:
+            await self.coordinator.async_toggle_light(False)
 
 
 class SomneoNightLight(SomneoEntity, LightEntity):
     """Representation of an Somneo Night light."""
 
-    _attr_should_poll = True
+    _data_keys = frozenset({"nightlight_is_on"})
     _attr_supported_color_modes: set[ColorMode | str] = {ColorMode.ONOFF}
     _attr_translation_key = "night_light"
 
@@ -84,13 +96,8 @@ class SomneoNightLight(SomneoEntity, LightEntity):
         return ColorMode.ONOFF
 
     @callback
-    def _handle_coordinator_update(self) -> None:
-        if not self.coordinator.data:
-            _LOGGER.debug("No data received from coordinator, skipping update.")
-            return
-        
+    def _update_attrs(self) -> None:
         self._attr_is_on = self.coordinator.data.get("nightlight_is_on", False)
-        self.async_write_ha_state()
 
     async def async_turn_on(self, **kwargs):
         """Instruct the light to turn on."""
@@ -40,7 +40,7 @@ async def async_setup_entry(
 class SomneoMediaPlayer(SomneoEntity, MediaPlayerEntity):
     """Representation of an Somneo Media player."""
 
-    _attr_should_poll = True
+    _data_keys = frozenset({"player"})
     _attr_supported_features = (
         MediaPlayerEntityFeature.VOLUME_SET
         | MediaPlayerEntityFeature.TURN_ON
@@ -51,7 +51,7 @@ class SomneoMediaPlayer(SomneoEntity, MediaPlayerEntity):
     _attr_translation_key = "player"
 
     @callback
-    def _handle_coordinator_update(self) -> None:
+    def _update_attrs(self) -> None:
         player_data = self.coordinator.data["player"]
         self._attr_state = (
             MediaPlayerState.ON
@@ -61,7 +61,6 @@ class SomneoMediaPlayer(SomneoEntity, MediaPlayerEntity):
         self._attr_volume_level = player_data["volume"]
         self._attr_source = player_data["source"]
         self._attr_source_list = player_data["possible_sources"]
-        self.async_write_ha_state()
 
     async def async_turn_on(self) -> None:
         """Instruct the light to turn on."""
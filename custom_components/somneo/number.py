@@ -1,18 +1,101 @@
 """Number entities for Somneo."""
 import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 
+from homeassistant.components.number import NumberEntity, NumberEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.components.number import NumberEntity
 from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from . import SomneoCoordinator
 from .const import DOMAIN
-from .entity import SomneoEntity
+from .entity import (
+    SomneoDescribedEntity,
+    SomneoEntityDescription,
+    async_add_alarm_entities,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, kw_only=True)
+class SomneoNumberEntityDescription(SomneoEntityDescription, NumberEntityDescription):
+    """Description of a Somneo number."""
+
+    # Called with the coordinator, the alarm (None if not an alarm) and value.
+    set_fn: Callable[[SomneoCoordinator, int | None, int], Awaitable[None]]
+
+
+POWERWAKE_DELTA = SomneoNumberEntityDescription(
+    key="powerwake_delta",
+    translation_key="powerwake_delta",
+    value_path=("powerwake_delta",),
+    alarm_suffix="_powerwake_delta",
+    native_min_value=0,
+    native_max_value=59,
+    native_step=1,
+    set_fn=lambda coordinator, alarm, value: coordinator.async_set_alarm_powerwake(
+        alarm, delta=value
+    ),
+)
+
+NUMBERS: tuple[SomneoNumberEntityDescription, ...] = (
+    SomneoNumberEntityDescription(
+        key="snooze",
+        translation_key="snooze_time",
+        value_path=("snooze_time",),
+        native_min_value=1,
+        native_max_value=20,
+        native_step=1,
+        set_fn=lambda coordinator, _, value: coordinator.async_set_snooze_time(value),
+    ),
+    SomneoNumberEntityDescription(
+        key="sunset_duration",
+        translation_key="sunset_duration",
+        value_path=("sunset", "duration"),
+        native_min_value=5,
+        native_max_value=60,
+        native_step=5,
+        set_fn=lambda coordinator, _, value: coordinator.async_set_sunset(
+            duration=value
+        ),
+    ),
+    SomneoNumberEntityDescription(
+        key="sunset_level",
+        translation_key="sunset_level",
+        value_path=("sunset", "level"),
+        native_min_value=0,
+        native_max_value=25,
+        native_step=1,
+        set_fn=lambda coordinator, _, value: coordinator.async_set_sunset(level=value),
+    ),
+    SomneoNumberEntityDescription(
+        key="sunset_volume",
+        translation_key="sunset_volume",
+        value_path=("sunset", "volume"),
+        native_min_value=1,
+        native_max_value=25,
+        native_step=1,
+        set_fn=lambda coordinator, _, value: coordinator.async_set_sunset(
+            volume=value
+        ),
+    ),
+    SomneoNumberEntityDescription(
+        key="display_brightness",
+        translation_key="display_brightness",
+        value_path=("display_brightness",),
+        native_min_value=1,
+        native_max_value=6,
+        native_step=1,
+        set_fn=lambda coordinator, _, value: coordinator.async_set_display(
+            brightness=value
+        ),
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -26,161 +109,36 @@ async def async_setup_entry(
     name = config_entry.data[CONF_NAME]
     device_info = config_entry.data["dev_info"]
 
-    alarms = []
-    # Add all PowerWake deltas
-    for alarm in list(coordinator.data["alarms"]):
-        alarms.append(SomneoPowerWake(coordinator, unique_id, name, device_info, alarm))
-
-    snooze = [SomneoSnooze(coordinator, unique_id, name, device_info, "snooze")]
-
-    sunset = [SomneoSunsetDuration(coordinator, unique_id, name, device_info, "sunset_duration"),
-              SomneoSunsetLevel(coordinator, unique_id, name, device_info, "sunset_level"),
-              SomneoSunsetVolume(coordinator, unique_id, name, device_info, "sunset_volume")
-    ]
-
-    display = [SomneoDisplayBrightness(coordinator, unique_id, name, device_info, "display_brightness")]
-
-    async_add_entities(alarms, update_before_add=True)
-    async_add_entities(snooze, update_before_add=True)
-    async_add_entities(sunset, update_before_add=True)
-    async_add_entities(display, update_before_add=True)
-
-
-class SomneoPowerWake(SomneoEntity, NumberEntity):
-    """Representation of a Powerwake number."""
-
-    _attr_should_poll = True
-    _attr_assumed_state = False
-    _attr_available = True
-    _attr_native_step = 1
-    _attr_has_entity_name = True
-    _attr_native_min_value = 0
-    _attr_native_max_value = 59
-    _attr_translation_key = "powerwake_delta"
-
-    def __init__(self, coordinator, unique_id, name, dev_info, alarm):
-        """Initialize number entities."""
-        super().__init__(
-            coordinator, unique_id, name, dev_info, "alarm" + str(alarm) + "_powerwake_delta"
-        )
-
-        self._attr_translation_placeholders = {"number": str(alarm)}
-
-        self._alarm = alarm
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle update"""
-        self._attr_native_value = self.coordinator.data["alarms"][self._alarm]["powerwake_delta"]
-        self.async_write_ha_state()
-
-    async def async_set_native_value(self, value: float) -> None:
-        """Called when user adjust Hours / Minutes in the UI"""
-        await self.coordinator.async_set_alarm_powerwake(self._alarm, delta=int(value))
-
-
-class SomneoSnooze(SomneoEntity, NumberEntity):
-    """Representation of a snooze time."""
-
-    _attr_should_poll = True
-    _attr_available = True
-    _attr_assumed_state = False
-    _attr_translation_key = "snooze_time"
-    _attr_native_min_value = 1
-    _attr_native_max_value = 20
-    _attr_native_step = 1
-    _attr_has_entity_name = True
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        self._attr_native_value = self.coordinator.data["snooze_time"]
-        self.async_write_ha_state()
-
-    async def async_set_native_value(self, value: float) -> None:
-        """Called when user adjust snooze time in the UI"""
-        await self.coordinator.async_set_snooze_time(int(value))
-
-class SomneoSunsetDuration(SomneoEntity, NumberEntity):
-    """Represenation of the Sunset duration."""
-
-    _attr_should_poll = True
-    _attr_available = True
-    _attr_assumed_state = False
-    _attr_translation_key = "sunset_duration"
-    _attr_native_min_value = 5
-    _attr_native_max_value = 60
-    _attr_native_step = 5
-    _attr_has_entity_name = True
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        self._attr_native_value = self.coordinator.data["sunset"]["duration"]
-        self.async_write_ha_state()
-
-    async def async_set_native_value(self, value: float) -> None:
-        """Called when user adjust snooze time in the UI"""
-        await self.coordinator.async_set_sunset(duration = int(value))
-
-class SomneoSunsetLevel(SomneoEntity, NumberEntity):
-    """Represenation of the Sunset level."""
+    # Add the PowerWake deltas
+    async_add_alarm_entities(
+        hass,
+        config_entry,
+        async_add_entities,
+        lambda alarm: [
+            SomneoNumber(
+                coordinator, unique_id, name, device_info, POWERWAKE_DELTA, alarm
+            )
+        ],
+    )
 
-    _attr_should_poll = True
-    _attr_available = True
-    _attr_assumed_state = False
-    _attr_translation_key = "sunset_level"
-    _attr_native_min_value = 0
-    _attr_native_max_value = 25
-    _attr_native_step = 1
-    _attr_has_entity_name = True
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        self._attr_native_value = self.coordinator.data["sunset"]["level"]
-        self.async_write_ha_state()
-
-    async def async_set_native_value(self, value: float) -> None:
-        """Called when user adjust snooze time in the UI"""
-        await self.coordinator.async_set_sunset(level = int(value))
-
-class SomneoSunsetVolume(SomneoEntity, NumberEntity):
-    """Represenation of the Sunset volume."""
-
-    _attr_should_poll = True
-    _attr_available = True
-    _attr_assumed_state = False
-    _attr_translation_key = "sunset_volume"
-    _attr_native_min_value = 1
-    _attr_native_max_value = 25
-    _attr_native_step = 1
-    _attr_has_entity_name = True
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        self._attr_native_value = self.coordinator.data["sunset"]["volume"]
-        self.async_write_ha_state()
-
-    async def async_set_native_value(self, value: float) -> None:
-        """Called when user adjust snooze time in the UI"""
-        await self.coordinator.async_set_sunset(volume = int(value))
+    async_add_entities(
+        [
+            SomneoNumber(coordinator, unique_id, name, device_info, description)
+            for description in NUMBERS
+        ],
+        update_before_add=True,
+    )
 
 
-class SomneoDisplayBrightness(SomneoEntity, NumberEntity):
-    """Represenation of the Sunset volume."""
+class SomneoNumber(SomneoDescribedEntity, NumberEntity):
+    """Representation of a Somneo number."""
 
-    _attr_should_poll = True
-    _attr_available = True
-    _attr_assumed_state = False
-    _attr_translation_key = "display_brightness"
-    _attr_native_min_value = 1
-    _attr_native_max_value = 6
-    _attr_native_step = 1
-    _attr_has_entity_name = True
+    entity_description: SomneoNumberEntityDescription
 
     @callback
-    def _handle_coordinator_update(self) -> None:
-        self._attr_native_value = self.coordinator.data["display_brightness"]
-        self.async_write_ha_state()
+    def _update_attrs(self) -> None:
+        self._attr_native_value = self._value(self.coordinator.data)
 
     async def async_set_native_value(self, value: float) -> None:
-        """Called when user adjust snooze time in the UI"""
-        await self.coordinator.async_set_display(brightness = int(value))
\ No newline at end of file
+        """Called when user adjusts the value in the UI."""
+        await self.entity_description.set_fn(self.coordinator, self._alarm, int(value))
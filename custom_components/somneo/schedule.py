@@ -0,0 +1,142 @@
+"""Local schedule of the Somneo alarms."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+
+@dataclass(frozen=True, slots=True)
+class AlarmOccurrence:
+    """A single wake-up of an alarm."""
+
+    alarm: int
+    start: datetime
+    # Time of the powerwake, if enabled.
+    powerwake: datetime | None
+
+
+@dataclass(frozen=True, slots=True)
+class _Slot:
+    """Schedule of an enabled alarm slot."""
+
+    time: time
+    # Weekdays (0 is monday) of a repeating alarm, None for a one-shot alarm.
+    weekdays: frozenset[int] | None
+    powerwake_delta: int
+    # A one-shot alarm goes off once, at its first time after this moment.
+    since: datetime
+
+    def key(self) -> tuple[Any, ...]:
+        """Return the settings of the slot."""
+        return (self.time, self.weekdays, self.powerwake_delta)
+
+
+def _local(day: date, at: time, now: datetime) -> datetime:
+    """Return a local time on a day.
+
+    A time in the gap of a DST change moves forward by the size of the gap,
+    an ambiguous time resolves to its first occurrence.
+    """
+    local = datetime.combine(day, at, now.tzinfo)
+    return local.astimezone(dt_util.UTC).astimezone(now.tzinfo)
+
+
+class AlarmSchedule:
+    """Index of the upcoming occurrences of the enabled alarms.
+
+    Only the slots whose settings changed are rebuilt on an update, and the
+    next occurrence of a slot is only recomputed once it has passed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the schedule."""
+        self._slots: dict[int, _Slot] = {}
+        self._next: dict[int, AlarmOccurrence | None] = {}
+
+    def update(self, alarms: dict[int, dict[str, Any]], now: datetime) -> bool:
+        """Update the schedule from the alarm table, return whether it changed."""
+        changed = False
+        for alarm in self._slots.keys() - alarms.keys():
+            del self._slots[alarm]
+            self._next.pop(alarm, None)
+            changed = True
+        for alarm, settings in alarms.items():
+            slot = self._slots.get(alarm)
+            if not settings["enabled"]:
+                if slot is not None:
+                    del self._slots[alarm]
+                    self._next.pop(alarm, None)
+                    changed = True
+                continue
+
+            days = settings["days"]
+            weekdays = (
+                None
+                if days == ["tomorrow"]
+                else frozenset(WEEKDAYS.index(day) for day in days if day in WEEKDAYS)
+            )
+            delta = settings["powerwake_delta"] if settings["powerwake"] else 0
+            if slot is not None and slot.key() == (settings["time"], weekdays, delta):
+                continue
+            self._slots[alarm] = _Slot(settings["time"], weekdays, delta, now)
+            self._next.pop(alarm, None)
+            changed = True
+        return changed
+
+    def next_occurrence(self, now: datetime) -> AlarmOccurrence | None:
+        """Return the first occurrence after now."""
+        upcoming = []
+        for alarm, slot in self._slots.items():
+            occurrence = self._next.get(alarm)
+            if occurrence is None or occurrence.start <= now:
+                occurrence = next(self._occurrences(alarm, slot, now), None)
+                self._next[alarm] = occurrence
+            if occurrence is not None:
+                upcoming.append(occurrence)
+        return min(upcoming, key=lambda occurrence: occurrence.start, default=None)
+
+    def upcoming(self, start: datetime, end: datetime) -> list[AlarmOccurrence]:
+        """Return the occurrences from start (inclusive) until end, in order."""
+        occurrences = []
+        for alarm, slot in self._slots.items():
+            for occurrence in self._occurrences(alarm, slot, start, inclusive=True):
+                if occurrence.start >= end:
+                    break
+                occurrences.append(occurrence)
+        return sorted(occurrences, key=lambda occurrence: occurrence.start)
+
+    @staticmethod
+    def _occurrences(
+        alarm: int, slot: _Slot, after: datetime, inclusive: bool = False
+    ):
+        """Yield the occurrences of a slot after (or at) a moment, in order."""
+        day = after.date()
+        if slot.weekdays is None:
+            # One-shot alarm, which the device disables once it went off.
+            start = _local(slot.since.date(), slot.time, after)
+            if start <= slot.since:
+                start = _local(slot.since.date() + timedelta(days=1), slot.time, after)
+            if start > after or (inclusive and start == after):
+                yield AlarmOccurrence(alarm, start, _powerwake(start, slot))
+            return
+        if not slot.weekdays:
+            return
+
+        while True:
+            if day.weekday() in slot.weekdays:
+                start = _local(day, slot.time, after)
+                if start > after or (inclusive and start == after):
+                    yield AlarmOccurrence(alarm, start, _powerwake(start, slot))
+            day += timedelta(days=1)
+
+
+def _powerwake(start: datetime, slot: _Slot) -> datetime | None:
+    """Return the time of the powerwake of an occurrence."""
+    if not slot.powerwake_delta:
+        return None
+    return start + timedelta(minutes=slot.powerwake_delta)
@@ -0,0 +1,71 @@
+"""Serialized, prioritized access to a Somneo device."""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+# Priorities of device operations, lower runs first.
+PRIORITY_COMMAND = 0
+PRIORITY_POLL = 1
+
+
+class RequestScheduler:
+    """Run device operations one at a time, in order of priority.
+
+    Operations waiting for the device are queued instead of dropped. When
+    the running operation finishes, the waiting operation with the highest
+    priority (then the oldest) goes next, so user commands overtake queued
+    background polls.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the scheduler."""
+        self._queue: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._counter = itertools.count()
+        self._busy = False
+
+    @property
+    def busy(self) -> bool:
+        """Return whether an operation is running."""
+        return self._busy
+
+    def queued(self, priority: int | None = None) -> int:
+        """Return the number of waiting operations (of a priority)."""
+        return sum(
+            1
+            for prio, _, waiter in self._queue
+            if not waiter.done() and priority in (None, prio)
+        )
+
+    @asynccontextmanager
+    async def async_slot(self, priority: int) -> AsyncIterator[None]:
+        """Wait for the device and hold it for the duration of the context."""
+        if self._busy:
+            waiter = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._queue, (priority, next(self._counter), waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # Hand over the device if it was granted just before the cancel.
+                if waiter.done() and not waiter.cancelled():
+                    self._release()
+                raise
+        else:
+            self._busy = True
+
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        """Pass the device on to the next waiting operation."""
+        while self._queue:
+            _, _, waiter = heapq.heappop(self._queue)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._busy = False
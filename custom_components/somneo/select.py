@@ -1,13 +1,16 @@
 """Select entities for Somneo."""
 import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 
-from homeassistant.components.select import SelectEntity
+from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from pysomneo import FM_PRESETS
 
+from . import SomneoCoordinator
 from .const import (
     CUSTOM,
     DOMAIN,
@@ -16,11 +19,62 @@ from .const import (
     WEEKEND,
     WORKDAYS,
 )
-from .entity import SomneoEntity
+from .entity import (
+    SomneoDescribedEntity,
+    SomneoEntityDescription,
+    async_add_alarm_entities,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, kw_only=True)
+class SomneoSelectEntityDescription(SomneoEntityDescription, SelectEntityDescription):
+    """Description of a Somneo select, the options use _ instead of spaces."""
+
+    # Options that depend on the themes of the device, instead of fixed options.
+    options_fn: Callable[[SomneoCoordinator], list[str]] | None = None
+    # Called with the coordinator, the alarm (None if not an alarm) and option.
+    select_fn: Callable[[SomneoCoordinator, int | None, str], Awaitable[None]]
+
+
+DAYS = SomneoSelectEntityDescription(
+    key="days",
+    translation_key="days",
+    value_path=("days_type",),
+    options=[WORKDAYS, WEEKEND, TOMORROW, EVERYDAY, CUSTOM],
+    select_fn=lambda coordinator, alarm, option: coordinator.async_set_alarm(
+        alarm, days=option
+    ),
+)
+
+SELECTS: tuple[SomneoSelectEntityDescription, ...] = (
+    SomneoSelectEntityDescription(
+        key="sunset_sound",
+        translation_key="sunset_sound",
+        value_path=("sunset", "sound"),
+        options_fn=lambda coordinator: [
+            item.replace(" ", "_")
+            for item in [*coordinator.somneo.dusk_sound_themes, *FM_PRESETS]
+        ],
+        select_fn=lambda coordinator, _, option: coordinator.async_set_sunset(
+            sound=option
+        ),
+    ),
+    SomneoSelectEntityDescription(
+        key="sunset_curve",
+        translation_key="sunset_curve",
+        value_path=("sunset", "curve"),
+        options_fn=lambda coordinator: [
+            item.replace(" ", "_") for item in coordinator.somneo.dusk_light_themes
+        ],
+        select_fn=lambda coordinator, _, option: coordinator.async_set_sunset(
+            curve=option
+        ),
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -34,113 +88,45 @@ async def async_setup_entry(
     name = config_entry.data[CONF_NAME]
     device_info = config_entry.data["dev_info"]
 
-    alarms = []
-    # Add hour & min number_entity for each alarms
-    for alarm in list(coordinator.data["alarms"]):
-        alarms.append(SomneoDays(coordinator, unique_id, name, device_info, alarm))
-
-    sunset = [
-        SomneoSunsetSound(coordinator, unique_id, name, device_info, "sunset_sound"),
-        SomneoSunsetCurve(coordinator, unique_id, name, device_info, "sunset_curve"),
-    ]
-
-    async_add_entities(alarms, update_before_add=True)
-    async_add_entities(sunset, update_before_add=True)
-
-
-class SomneoDays(SomneoEntity, SelectEntity):
-    """Representation of alarm days."""
-
-    _attr_should_poll = True
-    _attr_assumed_state = False
-    _attr_available = True
-    _attr_options = [WORKDAYS, WEEKEND, TOMORROW, EVERYDAY, CUSTOM]
-    _attr_current_option = WORKDAYS
-    _attr_translation_key = "days"
-
-    def __init__(self, coordinator, unique_id, name, dev_info, alarm):
-        """Initialize select entity for alarm days."""
-        super().__init__(coordinator, unique_id, name, dev_info, "alarm" + str(alarm))
-        self._attr_translation_placeholders = {"number": str(alarm)}
-        self._alarm = alarm
+    async_add_alarm_entities(
+        hass,
+        config_entry,
+        async_add_entities,
+        lambda alarm: [
+            SomneoSelect(coordinator, unique_id, name, device_info, DAYS, alarm)
+        ],
+    )
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        new_option = self.coordinator.data["alarms"][self._alarm]["days_type"]
-        if new_option != self._attr_current_option:
-            _LOGGER.debug(
-                "Alarm %s days changed: %s -> %s",
-                self._alarm,
-                self._attr_current_option,
-                new_option,
-            )
-            self._attr_current_option = new_option
-            self.async_write_ha_state()
-
-    async def async_select_option(self, option: str) -> None:
-        """Adjust the option in the UI."""
-        await self.coordinator.async_set_alarm(self._alarm, days=option)
-
-
-class SomneoSunsetSound(SomneoEntity, SelectEntity):
-    """Representation of a sunset sound source."""
-
-    _attr_should_poll = True
-    _attr_translation_key = "sunset_sound"
-    _attr_assumed_state = False
-    _attr_available = True
-    _attr_current_option = "soft_rain"
-
-    @property
-    def options(self) -> list:
-        """Return a set of selectable options."""
-        return [
-            item.replace(" ", "_") for item in self.coordinator.somneo.dusk_sound_themes
-        ] + [item.replace(" ", "_") for item in FM_PRESETS]
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        new_option = self.coordinator.data["sunset"]["sound"].replace(" ", "_")
-        if new_option != self._attr_current_option:
-            _LOGGER.debug(
-                "Sunset sound changed: %s -> %s",
-                self._attr_current_option,
-                new_option,
-            )
-            self._attr_current_option = new_option
-            self.async_write_ha_state()
-
-    async def async_select_option(self, option: str) -> None:
-        """Adjust the option in the UI."""
-        await self.coordinator.async_set_sunset(sound=option.replace("_", " "))
+    async_add_entities(
+        [
+            SomneoSelect(coordinator, unique_id, name, device_info, description)
+            for description in SELECTS
+        ],
+        update_before_add=True,
+    )
 
 
-class SomneoSunsetCurve(SomneoEntity, SelectEntity):
-    """Representation of a sunset curve."""
+class SomneoSelect(SomneoDescribedEntity, SelectEntity):
+    """Representation of a Somneo select."""
 
-    _attr_should_poll = True
-    _attr_translation_key = "sunset_curve"
-    _attr_assumed_state = False
-    _attr_available = True
-    _attr_current_option = "sunny_day"
+    entity_description: SomneoSelectEntityDescription
+    _attr_current_option = None
 
     @property
-    def options(self) -> list:
+    def options(self) -> list[str]:
         """Return a set of selectable options."""
-        return [item.replace(" ", "_") for item in self.coordinator.somneo.dusk_light_themes]
+        if self.entity_description.options_fn is not None:
+            return self.entity_description.options_fn(self.coordinator)
+        return super().options
 
     @callback
-    def _handle_coordinator_update(self) -> None:
-        new_option = self.coordinator.data["sunset"]["curve"].replace(" ", "_")
-        if new_option != self._attr_current_option:
-            _LOGGER.debug(
-                "Sunset curve changed: %s -> %s",
-                self._attr_current_option,
-                new_option,
-            )
-            self._attr_current_option = new_option
-            self.async_write_ha_state()
+    def _update_attrs(self) -> None:
+        self._attr_current_option = self._value(self.coordinator.data).replace(
+            " ", "_"
+        )
 
     async def async_select_option(self, option: str) -> None:
         """Adjust the option in the UI."""
-        await self.coordinator.async_set_sunset(curve=option.replace("_", " "))
+        await self.entity_description.select_fn(
+            self.coordinator, self._alarm, option.replace("_", " ")
+        )
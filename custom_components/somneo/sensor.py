@@ -1,22 +1,138 @@
 """Sensor entities for Somneo."""
 import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from time import monotonic
+from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import CONF_NAME, MATCH_ALL, EntityCategory, UnitOfTime
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 
-from .const import DOMAIN, SENSORS
-from .entity import SomneoEntity
+from .const import (
+    CONF_MAX_REPORT_INTERVAL,
+    CONF_MIN_REPORT_INTERVAL,
+    DEFAULT_MAX_REPORT_INTERVAL,
+    DEFAULT_MIN_REPORT_INTERVAL,
+    DOMAIN,
+    SENSOR_DEADBANDS,
+    SENSORS,
+)
+from .entity import SomneoDescribedEntity, SomneoEntity, SomneoEntityDescription
+from .stats import SomneoStats
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, kw_only=True)
+class SomneoSensorEntityDescription(SomneoEntityDescription, SensorEntityDescription):
+    """Description of a Somneo sensor."""
+
+
+@dataclass(frozen=True, kw_only=True)
+class SomneoStatSensorEntityDescription(SensorEntityDescription):
+    """Description of a sensor with request statistics."""
+
+    value_fn: Callable[[SomneoStats], Any]
+    attributes_fn: Callable[[SomneoStats], dict[str, Any]]
+
+
+MEASUREMENT_SENSORS: tuple[SomneoSensorEntityDescription, ...] = tuple(
+    SomneoSensorEntityDescription(
+        key=sensor,
+        translation_key=sensor,
+        value_path=(sensor,),
+        device_class=device_class,
+        native_unit_of_measurement=SENSORS[sensor],
+        state_class=SensorStateClass.MEASUREMENT,
+    )
+    for sensor, device_class in (
+        ("temperature", SensorDeviceClass.TEMPERATURE),
+        ("humidity", SensorDeviceClass.HUMIDITY),
+        ("luminance", SensorDeviceClass.ILLUMINANCE),
+        ("noise", SensorDeviceClass.SOUND_PRESSURE),
+    )
+)
+
+STATUS_SENSORS: tuple[SomneoSensorEntityDescription, ...] = (
+    SomneoSensorEntityDescription(
+        key="next",
+        translation_key="next_alarm",
+        value_path=("next_alarm",),
+        device_class=SensorDeviceClass.TIMESTAMP,
+    ),
+    SomneoSensorEntityDescription(
+        key="alarm_status",
+        translation_key="alarm_status",
+        value_path=("somneo_status",),
+    ),
+)
+
+
+def _latency(
+    key: str,
+    value_fn: Callable[[SomneoStats], Any],
+    attributes_fn: Callable[[SomneoStats], dict[str, Any]],
+) -> SomneoStatSensorEntityDescription:
+    """Return the description of a latency sensor (p95 in ms)."""
+    return SomneoStatSensorEntityDescription(
+        key=key,
+        translation_key=key,
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=value_fn,
+        attributes_fn=attributes_fn,
+    )
+
+
+STAT_SENSORS: tuple[SomneoStatSensorEntityDescription, ...] = (
+    _latency(
+        "fetch_latency",
+        lambda stats: stats.fetch.percentile(0.95),
+        lambda stats: stats.fetch.summary(),
+    ),
+    _latency(
+        "write_latency",
+        lambda stats: stats.write_percentile(0.95),
+        lambda stats: {name: hist.summary() for name, hist in stats.writes.items()},
+    ),
+    _latency(
+        "write_wait",
+        lambda stats: stats.write_wait.percentile(0.95),
+        lambda stats: stats.write_wait.summary(),
+    ),
+    _latency(
+        "poll_wait",
+        lambda stats: stats.poll_wait.percentile(0.95),
+        lambda stats: stats.poll_wait.summary(),
+    ),
+    SomneoStatSensorEntityDescription(
+        key="failures",
+        translation_key="failures",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda stats: stats.failures,
+        attributes_fn=lambda stats: {
+            "fetch": stats.fetch_failures,
+            "write": stats.write_failures,
+        },
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -30,77 +146,155 @@ async def async_setup_entry(
     name = config_entry.data[CONF_NAME]
     device_info = config_entry.data["dev_info"]
 
-    sensors = []
-    for sensor in list(SENSORS):
-        sensors.append(SomneoSensor(coordinator, unique_id, name, device_info, sensor))
-    sensors.append(
-        SomneoNextAlarmSensor(coordinator, unique_id, name, device_info, "next")
+    options = config_entry.options
+    sensors: list[SomneoEntity] = []
+    for description in MEASUREMENT_SENSORS:
+        sensors.append(
+            SomneoSensor(
+                coordinator,
+                unique_id,
+                name,
+                device_info,
+                description,
+                deadband=options.get(
+                    f"{description.key}_deadband",
+                    SENSOR_DEADBANDS[description.key][0],
+                ),
+                min_report_interval=options.get(
+                    CONF_MIN_REPORT_INTERVAL, DEFAULT_MIN_REPORT_INTERVAL
+                ),
+                max_report_interval=options.get(
+                    CONF_MAX_REPORT_INTERVAL, DEFAULT_MAX_REPORT_INTERVAL
+                ),
+            )
+        )
+    sensors.extend(
+        SomneoValueSensor(coordinator, unique_id, name, device_info, description)
+        for description in STATUS_SENSORS
     )
-    sensors.append(
-        SomneoAlarmStatus(coordinator, unique_id, name, device_info, "alarm_status")
+    sensors.extend(
+        SomneoStatSensor(coordinator, unique_id, name, device_info, description)
+        for description in STAT_SENSORS
     )
 
     async_add_entities(sensors, update_before_add=True)
 
 
-class SomneoSensor(SomneoEntity, SensorEntity):
-    """Representation of a Sensor."""
+class SomneoValueSensor(SomneoDescribedEntity, SensorEntity):
+    """Sensor showing a value of the coordinator data."""
+
+    entity_description: SomneoSensorEntityDescription
+
+    @callback
+    def _update_attrs(self) -> None:
+        self._attr_native_value = self._value(self.coordinator.data)
+
+
+class SomneoSensor(SomneoValueSensor):
+    """Representation of a Sensor.
 
-    _attr_state_class = SensorStateClass.MEASUREMENT
+    New values within the deadband of the reported value are held back until
+    the maximum report interval passed, and no value is reported sooner than
+    the minimum report interval after the previous one.
+    """
 
-    def __init__(self, coordinator, unique_id, name, dev_info, sensor_type):
+    _unsub_report: CALLBACK_TYPE | None = None
+
+    def __init__(
+        self,
+        coordinator,
+        unique_id,
+        name,
+        dev_info,
+        description: SomneoSensorEntityDescription,
+        deadband: float = 0,
+        min_report_interval: float = 0,
+        max_report_interval: float = 0,
+    ):
         """Initialize the sensor."""
-        super().__init__(coordinator, unique_id, name, dev_info, sensor_type)
+        super().__init__(coordinator, unique_id, name, dev_info, description)
+
+        self._deadband = deadband
+        self._relative = SENSOR_DEADBANDS[description.key][1]
+        self._min_report_interval = min_report_interval
+        self._max_report_interval = max_report_interval
+        self._reported_at = 0.0
+        self._report_due = False
 
-        self._attr_translation_key = sensor_type
-        self._attr_native_unit_of_measurement = SENSORS[sensor_type]
-        self._type = sensor_type
+    async def async_added_to_hass(self) -> None:
+        """Cancel a pending report when removed."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._cancel_report)
 
     @callback
-    def _handle_coordinator_update(self) -> None:
-        if self._type == "temperature":
-            self._attr_native_value = self.coordinator.data["temperature"]
-        if self._type == "humidity":
-            self._attr_native_value = self.coordinator.data["humidity"]
-        if self._type == "luminance":
-            self._attr_native_value = self.coordinator.data["luminance"]
-        if self._type == "noise":
-            self._attr_native_value = self.coordinator.data["noise"]
-        self.async_write_ha_state()
-
-    @property
-    def device_class(self) -> SensorDeviceClass:
-        """Return the class of this device, from component DEVICE_CLASSES."""
-        if self._type == "temperature":
-            return SensorDeviceClass.TEMPERATURE
-        if self._type == "humidity":
-            return SensorDeviceClass.HUMIDITY
-        if self._type == "luminance":
-            return SensorDeviceClass.ILLUMINANCE
-        if self._type == "noise":
-            return SensorDeviceClass.SOUND_PRESSURE
-        else:
-            return None
+    def _update_attrs(self) -> None:
+        value = self._value(self.coordinator.data)
+        if self._should_report(value):
+            self._attr_native_value = value
+            self._reported_at = monotonic()
 
+    def _should_report(self, value) -> bool:
+        """Return whether to report a value, or schedule reporting it later."""
+        self._cancel_report()
+        reported = self._attr_native_value
+        if self._report_due or reported is None or value is None:
+            self._report_due = False
+            return True
+        if value == reported:
+            return False
 
-class SomneoNextAlarmSensor(SomneoEntity, SensorEntity):
-    """Representation of a Next alarm sensor."""
+        delta = abs(value - reported)
+        if self._relative and reported:
+            delta = delta / abs(reported) * 100
+        if delta > self._deadband:
+            interval = self._min_report_interval
+        else:
+            interval = self._max_report_interval
+        delay = self._reported_at + interval - monotonic()
+        if delay <= 0:
+            return True
+        self._unsub_report = async_call_later(self.hass, delay, self._async_report)
+        return False
 
-    _attr_translation_key = "next_alarm"
-    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    @callback
+    def _async_report(self, _now: datetime) -> None:
+        """Report the held back value."""
+        self._unsub_report = None
+        self._report_due = True
+        self._handle_coordinator_update()
 
     @callback
-    def _handle_coordinator_update(self) -> None:
-        self._attr_native_value = self.coordinator.data["next_alarm"]
-        self.async_write_ha_state()
+    def _cancel_report(self) -> None:
+        """Cancel a scheduled report."""
+        if self._unsub_report is not None:
+            self._unsub_report()
+            self._unsub_report = None
+
 
+class SomneoStatSensor(SomneoEntity, SensorEntity):
+    """Diagnostic sensor with request statistics of the device."""
 
-class SomneoAlarmStatus(SomneoEntity, SensorEntity):
-    """Sensor entity that provides the current status of the alarm."""
+    entity_description: SomneoStatSensorEntityDescription
+    _data_keys = frozenset({"stats"})
+    _unrecorded_attributes = frozenset({MATCH_ALL})
+
+    def __init__(
+        self,
+        coordinator,
+        unique_id,
+        name,
+        dev_info,
+        description: SomneoStatSensorEntityDescription,
+    ):
+        """Initialize the sensor."""
+        super().__init__(coordinator, unique_id, name, dev_info, description.key)
 
-    _attr_translation_key = "alarm_status"
+        self.entity_description = description
 
     @callback
-    def _handle_coordinator_update(self) -> None:
-        self._attr_native_value = self.coordinator.data["somneo_status"]
-        self.async_write_ha_state()
+    def _update_attrs(self) -> None:
+        stats = self.coordinator.stats
+        self._attr_native_value = self.entity_description.value_fn(stats)
+        self._attr_extra_state_attributes = self.entity_description.attributes_fn(
+            stats
+        )
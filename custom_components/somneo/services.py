@@ -0,0 +1,122 @@
+"""Services of the Somneo integration."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from pysomneo import DAYS, DAYS_TYPE, SOUND_SOURCE_ALARM
+
+from .const import (
+    ALARMS,
+    ATTR_ALARM,
+    ATTR_CHANNEL,
+    ATTR_CURVE,
+    ATTR_DURATION,
+    ATTR_LEVEL,
+    ATTR_SOURCE,
+    DOMAIN,
+    PW,
+)
+
+if TYPE_CHECKING:
+    from . import SomneoCoordinator
+
+SERVICE_SET_ALARMS = "set_alarms"
+SERVICE_SNAPSHOT = "snapshot"
+SERVICE_RESTORE = "restore"
+ATTR_NAME = "name"
+DEFAULT_CONFIGURATION = "default"
+
+ALARM_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ALARM): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional("enabled"): cv.boolean,
+        vol.Optional("time"): cv.time,
+        vol.Optional("days"): vol.Any(
+            vol.In(list(DAYS_TYPE.values())),
+            vol.All(cv.ensure_list, [vol.In(list(DAYS.values()))]),
+        ),
+        vol.Optional(PW): vol.All(vol.Coerce(int), vol.Range(min=0, max=59)),
+        vol.Optional(ATTR_CURVE): vol.All(cv.string, vol.Lower),
+        vol.Optional(ATTR_LEVEL): vol.All(vol.Coerce(int), vol.Range(min=0, max=25)),
+        vol.Optional(ATTR_DURATION): vol.All(
+            vol.Coerce(int), vol.Range(min=5, max=40)
+        ),
+        vol.Optional(ATTR_SOURCE): vol.In(list(SOUND_SOURCE_ALARM)),
+        vol.Optional(ATTR_CHANNEL): vol.All(cv.string, vol.Lower),
+        vol.Optional("volume"): vol.All(vol.Coerce(int), vol.Range(min=1, max=25)),
+    }
+)
+
+SET_ALARMS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+        vol.Required(ALARMS): vol.All(cv.ensure_list, [ALARM_SCHEMA]),
+    }
+)
+
+CONFIGURATION_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+        vol.Optional(ATTR_NAME, default=DEFAULT_CONFIGURATION): cv.string,
+    }
+)
+
+
+@callback
+def _async_get_coordinator(hass: HomeAssistant, device_id: str) -> SomneoCoordinator:
+    """Return the coordinator of a Somneo device."""
+    if device := dr.async_get(hass).async_get(device_id):
+        for entry_id in device.config_entries:
+            if coordinator := hass.data.get(DOMAIN, {}).get(entry_id):
+                return coordinator
+    raise HomeAssistantError(f"Unknown Somneo device: {device_id}")
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the integration."""
+
+    async def async_set_alarms(call: ServiceCall) -> None:
+        """Program several alarms of a device at once."""
+        coordinator = _async_get_coordinator(hass, call.data[ATTR_DEVICE_ID])
+        alarms: dict[int, dict[str, Any]] = {}
+        for settings in call.data[ALARMS]:
+            alarm_settings = dict(settings)
+            alarms.setdefault(alarm_settings.pop(ATTR_ALARM), {}).update(
+                alarm_settings
+            )
+        if unknown := alarms.keys() - coordinator.data[ALARMS].keys():
+            raise HomeAssistantError(f"Unknown alarms: {sorted(unknown)}")
+
+        try:
+            await coordinator.async_set_alarms(alarms)
+        except ValueError as err:
+            raise HomeAssistantError(str(err)) from err
+
+    async def async_snapshot(call: ServiceCall) -> None:
+        """Store the settings of a device."""
+        coordinator = _async_get_coordinator(hass, call.data[ATTR_DEVICE_ID])
+        await coordinator.async_save_configuration(call.data[ATTR_NAME])
+
+    async def async_restore(call: ServiceCall) -> None:
+        """Restore stored settings of a device."""
+        coordinator = _async_get_coordinator(hass, call.data[ATTR_DEVICE_ID])
+        try:
+            await coordinator.async_restore_configuration(call.data[ATTR_NAME])
+        except ValueError as err:
+            raise HomeAssistantError(str(err)) from err
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_SET_ALARMS, async_set_alarms, schema=SET_ALARMS_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_SNAPSHOT, async_snapshot, schema=CONFIGURATION_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_RESTORE, async_restore, schema=CONFIGURATION_SCHEMA
+    )
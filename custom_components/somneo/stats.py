@@ -0,0 +1,129 @@
+"""Latency and failure statistics of a Somneo device."""
+from __future__ import annotations
+
+from collections import deque
+from typing import Any
+
+# Upper bounds (ms) of the latency histogram buckets, the last one is open.
+BUCKETS = (50, 100, 250, 500, 1000, 2500, 5000)
+# Number of recent samples the rolling summary is based on.
+WINDOW = 100
+
+
+def _percentile(samples: list[float], fraction: float) -> float | None:
+    """Return a percentile of the samples."""
+    if not samples:
+        return None
+    samples = sorted(samples)
+    return round(samples[min(len(samples) - 1, int(len(samples) * fraction))], 1)
+
+
+class LatencyHistogram:
+    """Histogram of latencies with a rolling window of recent samples."""
+
+    def __init__(self) -> None:
+        """Initialize the histogram."""
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(BUCKETS) + 1)
+        self.recent: deque[float] = deque(maxlen=WINDOW)
+
+    def record(self, seconds: float) -> None:
+        """Record a latency."""
+        ms = seconds * 1000
+        self.count += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+        self.recent.append(ms)
+        for idx, bound in enumerate(BUCKETS):
+            if ms <= bound:
+                self.buckets[idx] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return a percentile (ms) of the recent samples."""
+        return _percentile(list(self.recent), fraction)
+
+    def summary(self) -> dict[str, Any]:
+        """Return a summary of the histogram."""
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 1) if self.count else None,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "max": round(self.max, 1),
+            "buckets": {
+                f"<={bound}": count
+                for bound, count in zip(BUCKETS, self.buckets, strict=False)
+            }
+            | {f">{BUCKETS[-1]}": self.buckets[-1]},
+        }
+
+
+class SomneoStats:
+    """Instrumentation of the requests to a single device."""
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.fetch = LatencyHistogram()
+        self.writes: dict[str, LatencyHistogram] = {}
+        self.write_wait = LatencyHistogram()
+        self.poll_wait = LatencyHistogram()
+        self.fetch_failures = 0
+        self.write_failures = 0
+        # Incremented on every change, to detect changes cheaply.
+        self.version = 0
+
+    @property
+    def failures(self) -> int:
+        """Return the total number of failed requests."""
+        return self.fetch_failures + self.write_failures
+
+    def record_fetch(self, seconds: float) -> None:
+        """Record the duration of a poll."""
+        self.fetch.record(seconds)
+        self.version += 1
+
+    def record_write(self, name: str, seconds: float) -> None:
+        """Record the duration of a write."""
+        self.writes.setdefault(name, LatencyHistogram()).record(seconds)
+        self.version += 1
+
+    def record_write_wait(self, seconds: float) -> None:
+        """Record the time a write waited for the device."""
+        self.write_wait.record(seconds)
+        self.version += 1
+
+    def record_poll_wait(self, seconds: float) -> None:
+        """Record the time a poll waited for the device."""
+        self.poll_wait.record(seconds)
+        self.version += 1
+
+    def record_failure(self, write: bool = False) -> None:
+        """Record a failed poll or write."""
+        if write:
+            self.write_failures += 1
+        else:
+            self.fetch_failures += 1
+        self.version += 1
+
+    def write_percentile(self, fraction: float) -> float | None:
+        """Return a percentile (ms) of the recent writes of all methods."""
+        return _percentile(
+            [sample for hist in self.writes.values() for sample in hist.recent],
+            fraction,
+        )
+
+    def summary(self) -> dict[str, Any]:
+        """Return a rolling summary of all statistics."""
+        return {
+            "fetch": self.fetch.summary(),
+            "writes": {name: hist.summary() for name, hist in self.writes.items()},
+            "write_wait": self.write_wait.summary(),
+            "poll_wait": self.poll_wait.summary(),
+            "fetch_failures": self.fetch_failures,
+            "write_failures": self.write_failures,
+        }
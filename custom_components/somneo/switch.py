@@ -1,9 +1,11 @@
 """Switch entities for Somneo."""
 import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from typing import Any
 
 import voluptuous as vol
-from homeassistant.components.switch import SwitchEntity
+from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant, callback
@@ -11,6 +13,7 @@ from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from . import SomneoCoordinator
 from .const import (
     ATTR_CHANNEL,
     ATTR_CURVE,
@@ -19,11 +22,63 @@ from .const import (
     ATTR_SOURCE,
     DOMAIN,
 )
-from .entity import SomneoEntity
+from .entity import (
+    SomneoDescribedEntity,
+    SomneoEntityDescription,
+    async_add_alarm_entities,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, kw_only=True)
+class SomneoSwitchEntityDescription(SomneoEntityDescription, SwitchEntityDescription):
+    """Description of a Somneo switch."""
+
+    # Called with the coordinator, the alarm (None if not an alarm) and state.
+    toggle_fn: Callable[[SomneoCoordinator, int | None, bool], Awaitable[None]]
+
+
+ALARM = SomneoSwitchEntityDescription(
+    key="alarm",
+    translation_key="alarm",
+    value_path=("enabled",),
+    attributes=("time", "days", "powerwake", "powerwake_delta"),
+    toggle_fn=lambda coordinator, alarm, state: coordinator.async_toggle_alarm(
+        alarm, state
+    ),
+)
+
+POWERWAKE = SomneoSwitchEntityDescription(
+    key="powerwake",
+    translation_key="powerwake",
+    value_path=("powerwake",),
+    attributes=("powerwake_delta",),
+    alarm_suffix="_PW",
+    toggle_fn=lambda coordinator, alarm, state: (
+        coordinator.async_toggle_alarm_powerwake(alarm, state)
+    ),
+)
+
+SWITCHES: tuple[SomneoSwitchEntityDescription, ...] = (
+    SomneoSwitchEntityDescription(
+        key="sunset",
+        translation_key="sunset",
+        value_path=("sunset", "is_on"),
+        attributes=("duration", "curve", "level", "sound", "volume"),
+        toggle_fn=lambda coordinator, _, state: coordinator.async_toggle_sunset(state),
+    ),
+    SomneoSwitchEntityDescription(
+        key="display_on",
+        translation_key="display_on",
+        value_path=("display_always_on",),
+        toggle_fn=lambda coordinator, _, state: coordinator.async_set_display(
+            state=state
+        ),
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -37,24 +92,25 @@ async def async_setup_entry(
     name = config_entry.data[CONF_NAME]
     device_info = config_entry.data["dev_info"]
 
-    alarms = []
-    pwrwk = []
-    for alarm in list(coordinator.data["alarms"]):
-        alarms.append(
-            SomneoAlarmToggle(coordinator, unique_id, name, device_info, alarm)
-        )
-        pwrwk.append(
-            SomneoPowerWakeToggle(coordinator, unique_id, name, device_info, alarm)
-        )
-
-    sunset = [SomneoSunsetToggle(coordinator, unique_id, name, device_info, "sunset")]
-
-    display = [SomneoDisplayToggle(coordinator, unique_id, name, device_info, 'display_on')]
+    async_add_alarm_entities(
+        hass,
+        config_entry,
+        async_add_entities,
+        lambda alarm: [
+            SomneoAlarmToggle(coordinator, unique_id, name, device_info, ALARM, alarm),
+            SomneoSwitch(
+                coordinator, unique_id, name, device_info, POWERWAKE, alarm
+            ),
+        ],
+    )
 
-    async_add_entities(alarms, update_before_add=True)
-    async_add_entities(pwrwk, update_before_add=True)
-    async_add_entities(sunset, update_before_add=True)
-    async_add_entities(display, update_before_add=True)
+    async_add_entities(
+        [
+            SomneoSwitch(coordinator, unique_id, name, device_info, description)
+            for description in SWITCHES
+        ],
+        update_before_add=True,
+    )
 
     platform = entity_platform.async_get_current_platform()
 
@@ -83,42 +139,41 @@ async def async_setup_entry(
     platform.async_register_entity_service("add_alarm", {}, "add_alarm")
 
 
-class SomneoAlarmToggle(SomneoEntity, SwitchEntity):
-    """Representation of a alarm switch."""
-
-    _attr_should_poll = True
-    _attr_translation_key = "alarm"
-
-    def __init__(self, coordinator, unique_id, name, device_info, alarm):
-        """Initialize the switches."""
-        super().__init__(
-            coordinator, unique_id, name, device_info, "alarm" + str(alarm)
-        )
+class SomneoSwitch(SomneoDescribedEntity, SwitchEntity):
+    """Representation of a Somneo switch."""
 
-        self._attr_translation_placeholders  = {"number": str(alarm)}
-        self._alarm = alarm
+    entity_description: SomneoSwitchEntityDescription
+    # The settings have their own entities, do not record them again.
+    _unrecorded_attributes = frozenset(
+        {
+            "time",
+            "days",
+            "powerwake",
+            "powerwake_delta",
+            "duration",
+            "curve",
+            "level",
+            "sound",
+            "volume",
+        }
+    )
 
     @callback
-    def _handle_coordinator_update(self) -> None:
-        self._attr_is_on = self.coordinator.data["alarms"][self._alarm]["enabled"]
-
-        self._attr_extra_state_attributes = {
-            "time": self.coordinator.data["alarms"][self._alarm]["time"],
-            "days": self.coordinator.data["alarms"][self._alarm]["days"],
-            "powerwake": self.coordinator.data["alarms"][self._alarm]["powerwake"],
-            "powerwake_delta": self.coordinator.data["alarms"][self._alarm][
-                "powerwake_delta"
-            ],
-        }
-        self.async_write_ha_state()
+    def _update_attrs(self) -> None:
+        self._attr_is_on = self._value(self.coordinator.data)
+        super()._update_attrs()
 
     async def async_turn_on(self, **kwargs: Any):
         """Turn on the switch."""
-        await self.coordinator.async_toggle_alarm(self._alarm, True)
+        await self.entity_description.toggle_fn(self.coordinator, self._alarm, True)
 
     async def async_turn_off(self, **kwargs: Any):
         """Turn off the switch."""
-        await self.coordinator.async_toggle_alarm(self._alarm, False)
+        await self.entity_description.toggle_fn(self.coordinator, self._alarm, False)
+
+
+class SomneoAlarmToggle(SomneoSwitch):
+    """Representation of a alarm switch."""
 
     # Define service-calls
     async def set_alarm_light(
@@ -144,83 +199,3 @@ class SomneoAlarmToggle(SomneoEntity, SwitchEntity):
     async def add_alarm(self):
         """Add alarm to list in wake-up app."""
         await self.coordinator.async_add_alarm(self._alarm)
-
-
-class SomneoPowerWakeToggle(SomneoEntity, SwitchEntity):
-    """Representation of a Powerwake switch."""
-
-    _attr_should_poll = True
-    _attr_translation_key = "powerwake"
-
-    def __init__(self, coordinator, unique_id, name, device_info, alarm):
-        """Initialize the switches."""
-        super().__init__(
-            coordinator, unique_id, name, device_info, "alarm" + str(alarm) + "_PW"
-        )
-
-        self._attr_translation_placeholders  = {"number": str(alarm)}
-        self._alarm = alarm
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        self._attr_is_on = self.coordinator.data["alarms"][self._alarm]["powerwake"]
-        self._attr_extra_state_attributes = {
-            "powerwake_delta": self.coordinator.data["alarms"][self._alarm][
-                "powerwake_delta"
-            ]
-        }
-        self.async_write_ha_state()
-
-    async def async_turn_on(self, **kwargs: Any):
-        """Turn on the switch."""
-        await self.coordinator.async_toggle_alarm_powerwake(self._alarm, True)
-
-    async def async_turn_off(self, **kwargs: Any):
-        """Turn off the switch."""
-        await self.coordinator.async_toggle_alarm_powerwake(self._alarm, False)
-
-
-class SomneoSunsetToggle(SomneoEntity, SwitchEntity):
-    """Representation of a Sunset switch."""
-
-    _attr_should_poll = True
-    _attr_translation_key = "sunset"
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        self._attr_is_on = self.coordinator.data["sunset"]["is_on"]
-        self._attr_extra_state_attributes = {
-            "duration": self.coordinator.data["sunset"]["duration"],
-            "curve": self.coordinator.data["sunset"]["curve"],
-            "level": self.coordinator.data["sunset"]["level"],
-            "sound": self.coordinator.data["sunset"]["sound"],
-            "volume": self.coordinator.data["sunset"]["volume"],
-        }
-        self.async_write_ha_state()
-
-    async def async_turn_on(self, **kwargs: Any):
-        """Turn on the switch."""
-        await self.coordinator.async_toggle_sunset(True)
-
-    async def async_turn_off(self, **kwargs: Any):
-        """Turn off the switch."""
-        await self.coordinator.async_toggle_sunset(False)
-
-class SomneoDisplayToggle(SomneoEntity, SwitchEntity):
-    """Representation of a display always on switch."""
-
-    _attr_should_poll = True
-    _attr_translation_key = 'display_on'
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        self._attr_is_on = self.coordinator.data["display_always_on"]
-        self.async_write_ha_state()
-
-    async def async_turn_on(self, **kwargs: Any):
-        """Turn on the switch."""
-        await self.coordinator.async_set_display(state=True)
-
-    async def async_turn_off(self, **kwargs: Any):
-        """Turn off the switch."""
-        await self.coordinator.async_set_display(state=False)
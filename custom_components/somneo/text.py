@@ -1,18 +1,36 @@
 """Text entities for Somneo."""
 import logging
+from dataclasses import dataclass
 
-from homeassistant.components.text import TextEntity
+from homeassistant.components.text import TextEntity, TextEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
-from .entity import SomneoEntity
+from .entity import (
+    SomneoDescribedEntity,
+    SomneoEntityDescription,
+    async_add_alarm_entities,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, kw_only=True)
+class SomneoTextEntityDescription(SomneoEntityDescription, TextEntityDescription):
+    """Description of a Somneo text."""
+
+
+ALARM_DAYS = SomneoTextEntityDescription(
+    key="days_str",
+    translation_key="days_str",
+    value_path=("days",),
+    pattern="^((tomorrow|mon|tue|wed|thu|fri|sat|sun)(,)?)+$",
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -26,39 +44,28 @@ async def async_setup_entry(
     name = config_entry.data[CONF_NAME]
     device_info = config_entry.data["dev_info"]
 
-    alarms = []
-    for alarm in list(coordinator.data["alarms"]):
-        alarms.append(SomneoAlarmDays(coordinator, unique_id, name, device_info, alarm))
+    async_add_alarm_entities(
+        hass,
+        config_entry,
+        async_add_entities,
+        lambda alarm: [
+            SomneoAlarmDays(
+                coordinator, unique_id, name, device_info, ALARM_DAYS, alarm
+            )
+        ],
+    )
 
-    async_add_entities(alarms, update_before_add=True)
 
+class SomneoAlarmDays(SomneoDescribedEntity, TextEntity):
+    """Representation of the days of an alarm."""
 
-class SomneoAlarmDays(SomneoEntity, TextEntity):
-    """Representation of a alarm switch."""
-
-    _attr_should_poll = True
-    _attr_assumed_state = False
-    _attr_available = True
     _attr_native_value = None
-    _attr_pattern = "^((tomorrow|mon|tue|wed|thu|fri|sat|sun)(,)?)+$"
-    _attr_translation_key = "days_str"
-
-    def __init__(self, coordinator, unique_id, name, device_info, alarm):
-        """Initialize the switches."""
-        super().__init__(
-            coordinator, unique_id, name, device_info, "alarm" + str(alarm)
-        )
-
-        self._attr_translation_placeholders = {"number": str(alarm)}
-        self._alarm = alarm
 
     @callback
-    def _handle_coordinator_update(self) -> None:
-        days_list = self.coordinator.data["alarms"][self._alarm]["days"]
+    def _update_attrs(self) -> None:
+        days_list = self._value(self.coordinator.data)
         self._attr_native_value = ",".join([str(item) for item in days_list if item])
 
-        self.async_write_ha_state()
-
     async def async_set_value(self, value: str) -> None:
         """Set the text value."""
         await self.coordinator.async_set_alarm(self._alarm, days=value.split(","))
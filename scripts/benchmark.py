@@ -0,0 +1,406 @@
+"""Benchmark the Somneo integration against fake devices.
+
+Boots a minimal Home Assistant with the integration from this repository,
+sets up one config entry per fake device (see ``fake_somneo.py``) and
+measures for every requested number of devices:
+
+- the poll cycle time of the coordinators (regular and full polls),
+- the time from a light ``turn_on`` service call to the optimistic state being
+  visible, and to the device write and read-back being done,
+- the number of ``async_write_ha_state`` calls per poll tick,
+- the executor jobs and device requests per minute during a soak period,
+- the memory allocated per config entry.
+
+The results are written as JSON, to track regressions between releases::
+
+    python scripts/benchmark.py --devices 1 10 50 --output benchmark.json
+
+The fake devices run on their own event loop in a separate thread, so their
+request handling is not accounted to the Home Assistant event loop.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import gc
+import json
+import logging
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable, Coroutine
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from homeassistant import bootstrap, config_entries, core, loader
+from homeassistant.const import __version__ as HA_VERSION
+from homeassistant.core_config import async_process_ha_core_config
+from homeassistant.helpers import entity as entity_helper
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.setup import async_setup_component
+
+from fake_somneo import FakeSomneo, self_signed_context
+
+_LOGGER = logging.getLogger(__name__)
+
+ROOT = Path(__file__).resolve().parent.parent
+INTEGRATION = ROOT / "custom_components" / "somneo"
+DOMAIN = "somneo"
+
+
+class DeviceThread:
+    """Run fake devices on an event loop in a separate thread."""
+
+    def __init__(self) -> None:
+        """Initialize the thread."""
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="fake_somneo", daemon=True
+        )
+        self._ssl_context = self_signed_context()
+        self.devices: list[FakeSomneo] = []
+
+    def _run(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """Run a coroutine on the device loop and wait for the result."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def start(self, count: int, latency: float, jitter: float) -> None:
+        """Start the thread and the devices."""
+        self._thread.start()
+        for _ in range(count):
+            device = FakeSomneo(
+                latency=latency, jitter=jitter, ssl_context=self._ssl_context
+            )
+            self._run(device.start())
+            self.devices.append(device)
+
+    def stop(self) -> None:
+        """Stop the devices and the thread."""
+        for device in self.devices:
+            self._run(device.stop())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    @property
+    def request_count(self) -> int:
+        """Return the number of requests handled by all devices."""
+        return sum(sum(device.requests.values()) for device in self.devices)
+
+    def change_sensors(self) -> None:
+        """Let the temperature of every device drift."""
+        for device in self.devices:
+            self._loop.call_soon_threadsafe(_drift, device)
+
+
+def _drift(device: FakeSomneo) -> None:
+    """Change the temperature of a device."""
+    sensors = device.state["wusrd"]
+    sensors["mstmp"] = round(sensors["mstmp"] + 0.1, 1)
+
+
+class Counters:
+    """Count state writes and executor jobs."""
+
+    def __init__(self, hass: core.HomeAssistant) -> None:
+        """Install the counting wrappers."""
+        self.state_writes = 0
+        self.executor_jobs = 0
+
+        write_ha_state = entity_helper.Entity.async_write_ha_state
+        run_in_executor = hass.loop.run_in_executor
+
+        def counting_write_ha_state(entity: entity_helper.Entity) -> None:
+            self.state_writes += 1
+            write_ha_state(entity)
+
+        def counting_run_in_executor(*args: Any) -> asyncio.Future[Any]:
+            self.executor_jobs += 1
+            return run_in_executor(*args)
+
+        self._restore: list[Callable[[], None]] = [
+            lambda: setattr(
+                entity_helper.Entity, "async_write_ha_state", write_ha_state
+            ),
+            lambda: vars(hass.loop).pop("run_in_executor", None),
+        ]
+        entity_helper.Entity.async_write_ha_state = counting_write_ha_state
+        hass.loop.run_in_executor = counting_run_in_executor
+
+    def restore(self) -> None:
+        """Remove the counting wrappers."""
+        for restore in self._restore:
+            restore()
+
+
+def _stats(samples: list[float]) -> dict[str, float | int]:
+    """Summarize timing samples in milliseconds."""
+    if not samples:
+        return {"count": 0}
+    samples = sorted(samples)
+    return {
+        "count": len(samples),
+        "mean": round(statistics.fmean(samples) * 1000, 2),
+        "p50": round(samples[len(samples) // 2] * 1000, 2),
+        "p95": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1000, 2),
+        "max": round(samples[-1] * 1000, 2),
+    }
+
+
+async def _async_start_hass(config_dir: Path) -> core.HomeAssistant:
+    """Start a minimal Home Assistant with a clean storage."""
+    shutil.rmtree(config_dir / ".storage", ignore_errors=True)
+    hass = core.HomeAssistant(str(config_dir))
+    loader.async_setup(hass)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await bootstrap.async_load_base_functionality(hass)
+    await async_process_ha_core_config(hass, {"time_zone": "UTC"})
+    # The shared aiohttp session resolves hosts with the network integration.
+    await async_setup_component(hass, "network", {})
+    hass.set_state(core.CoreState.running)
+    return hass
+
+
+async def _async_add_entries(
+    hass: core.HomeAssistant, devices: list[FakeSomneo]
+) -> list[config_entries.ConfigEntry]:
+    """Set up a config entry per device."""
+    entries = []
+    for device in devices:
+        entry = config_entries.ConfigEntry(
+            domain=DOMAIN,
+            version=4,
+            minor_version=1,
+            title=device.serial,
+            data={
+                "host": device.address,
+                "name": device.serial,
+                "dev_info": {
+                    "manufacturer": "Royal Philips Electronics",
+                    "model": "Wake-up Light",
+                    "modelnumber": "HF367x",
+                    "serial": device.serial,
+                },
+            },
+            options={},
+            source=config_entries.SOURCE_USER,
+            unique_id=device.serial,
+            discovery_keys={},
+            subentries_data=None,
+        )
+        await hass.config_entries.async_add(entry)
+        entries.append(entry)
+    await hass.async_block_till_done()
+    return entries
+
+
+async def _async_poll_all(coordinators: list[Any]) -> list[float]:
+    """Refresh all coordinators concurrently, return the time of each."""
+
+    async def timed_refresh(coordinator: Any) -> float:
+        start = time.perf_counter()
+        await coordinator.async_refresh()
+        return time.perf_counter() - start
+
+    return list(await asyncio.gather(*map(timed_refresh, coordinators)))
+
+
+async def _async_turn_on_latency(
+    hass: core.HomeAssistant, entity_id: str
+) -> tuple[float, float]:
+    """Return the time from a turn_on service call to the state being on.
+
+    The first time is the optimistic state, which is shown before the device
+    is written. The second one is the round trip of the device, until the
+    write and the read-back of the light are done.
+    """
+    visible = hass.loop.create_future()
+
+    @core.callback
+    def state_changed(event: core.Event[Any]) -> None:
+        new_state = event.data["new_state"]
+        if new_state is not None and new_state.state == "on" and not visible.done():
+            visible.set_result(time.perf_counter())
+
+    unsub = async_track_state_change_event(hass, entity_id, state_changed)
+    try:
+        start = time.perf_counter()
+        await asyncio.wait_for(
+            hass.services.async_call(
+                "light",
+                "turn_on",
+                {"entity_id": entity_id, "brightness": 128},
+                blocking=True,
+            ),
+            10,
+        )
+        done = time.perf_counter()
+        return await asyncio.wait_for(visible, 10) - start, done - start
+    finally:
+        unsub()
+        await hass.services.async_call(
+            "light", "turn_off", {"entity_id": entity_id}, blocking=True
+        )
+
+
+async def async_benchmark(
+    config_dir: Path, count: int, args: argparse.Namespace
+) -> dict[str, Any]:
+    """Run the benchmark for a number of devices."""
+    device_thread = DeviceThread()
+    device_thread.start(count, args.latency, args.jitter)
+
+    hass = await _async_start_hass(config_dir)
+    counters = Counters(hass)
+    try:
+        gc.collect()
+        tracemalloc.start()
+        memory_before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        entries = await _async_add_entries(hass, device_thread.devices)
+        setup_time = time.perf_counter() - start
+        gc.collect()
+        memory_after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        entity_count = len(hass.states.async_all())
+
+        coordinators = [hass.data[DOMAIN][entry.entry_id] for entry in entries]
+        registry = er.async_get(hass)
+        lights = [
+            entity.entity_id
+            for entry in entries
+            for entity in er.async_entries_for_config_entry(
+                registry, entry.entry_id
+            )
+            if entity.translation_key == "normal_light"
+        ]
+
+        poll_times: list[float] = []
+        for _ in range(args.cycles):
+            poll_times += await _async_poll_all(coordinators)
+
+        full_poll_times: list[float] = []
+        for _ in range(args.cycles):
+            for coordinator in coordinators:
+                coordinator.somneo.last_fetch.clear()
+            full_poll_times += await _async_poll_all(coordinators)
+
+        await hass.async_block_till_done()
+        counters.state_writes = 0
+        await _async_poll_all(coordinators)
+        await hass.async_block_till_done()
+        idle_writes = counters.state_writes
+
+        device_thread.change_sensors()
+        for coordinator in coordinators:
+            coordinator.somneo.last_fetch.clear()
+        await asyncio.sleep(0.1)
+        counters.state_writes = 0
+        await _async_poll_all(coordinators)
+        await hass.async_block_till_done()
+        sensor_writes = counters.state_writes
+
+        turn_on_times = [
+            await _async_turn_on_latency(hass, entity_id)
+            for entity_id in lights[: args.samples]
+        ]
+
+        # Let the coordinators poll on their own schedule for a while.
+        counters.executor_jobs = 0
+        counters.state_writes = 0
+        requests_before = device_thread.request_count
+        soak_start = time.perf_counter()
+        while (elapsed := time.perf_counter() - soak_start) < args.soak:
+            device_thread.change_sensors()
+            await asyncio.sleep(min(10, args.soak - elapsed))
+        soak_minutes = (time.perf_counter() - soak_start) / 60
+        requests = device_thread.request_count - requests_before
+
+        for entry in entries:
+            await hass.config_entries.async_unload(entry.entry_id)
+    finally:
+        counters.restore()
+        await hass.async_stop(force=True)
+        device_thread.stop()
+
+    return {
+        "devices": count,
+        "entities": entity_count,
+        "setup_s": round(setup_time, 3),
+        "memory_per_entry_kib": round((memory_after - memory_before) / count / 1024, 1),
+        "poll_cycle_ms": _stats(poll_times),
+        "full_poll_cycle_ms": _stats(full_poll_times),
+        "turn_on_to_optimistic_state_ms": _stats(
+            [optimistic for optimistic, _ in turn_on_times]
+        ),
+        "turn_on_to_device_ms": _stats([device for _, device in turn_on_times]),
+        "state_writes_per_tick": {"idle": idle_writes, "sensor_change": sensor_writes},
+        "soak_s": round(soak_minutes * 60, 1),
+        "state_writes_per_min": round(counters.state_writes / soak_minutes, 1),
+        "executor_jobs_per_min": round(counters.executor_jobs / soak_minutes, 1),
+        "device_requests_per_min": round(requests / soak_minutes, 1),
+    }
+
+
+async def async_main(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the benchmark for all requested numbers of devices."""
+    manifest = json.loads((INTEGRATION / "manifest.json").read_text())
+    results = []
+    # Home Assistant only scans the custom components of the first config
+    # dir, so all runs share it.
+    with tempfile.TemporaryDirectory() as tmp:
+        config_dir = Path(tmp)
+        (config_dir / "custom_components").mkdir()
+        (config_dir / "custom_components" / DOMAIN).symlink_to(INTEGRATION)
+        for count in args.devices:
+            _LOGGER.info("Benchmarking %s device(s)", count)
+            results.append(await async_benchmark(config_dir, count, args))
+    return {
+        "meta": {
+            "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+            "integration_version": manifest["version"],
+            "homeassistant_version": HA_VERSION,
+            "python_version": platform.python_version(),
+            "latency_s": args.latency,
+            "jitter_s": args.jitter,
+            "cycles": args.cycles,
+        },
+        "results": results,
+    }
+
+
+def main() -> None:
+    """Parse the command line and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.02, help="seconds")
+    parser.add_argument("--cycles", type=int, default=10, help="polls to time")
+    parser.add_argument(
+        "--samples", type=int, default=10, help="lights to time turn_on for"
+    )
+    parser.add_argument("--soak", type=float, default=60, help="seconds")
+    parser.add_argument("--output", type=Path, help="JSON file (default stdout)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    _LOGGER.setLevel(logging.INFO)
+    result = asyncio.run(async_main(args))
+    output = json.dumps(result, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    else:
+        with contextlib.suppress(BrokenPipeError):
+            sys.stdout.write(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
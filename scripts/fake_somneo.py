@@ -0,0 +1,373 @@
+"""Local stand-in for the HTTPS API of a Philips Somneo.
+
+Emulates the endpoints used by the integration (sensors, light, alarms,
+sunset, player, display and device info) with stateful writes, configurable
+latency and error injection, so the integration can be exercised and
+benchmarked without a physical lamp.
+
+Run standalone::
+
+    python scripts/fake_somneo.py --port 8443 --latency 0.05 --error-rate 0.01
+
+and configure the integration with host ``127.0.0.1:8443``. With
+``--devices N`` the devices listen on consecutive ports. The server can also
+be embedded with :class:`FakeSomneo`; set ``offline`` to emulate an
+unplugged lamp and inspect ``requests`` to count the calls per endpoint.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import datetime
+import ipaddress
+import logging
+import random
+import ssl
+import tempfile
+from copy import deepcopy
+from pathlib import Path
+from typing import Any
+
+from aiohttp import web
+
+_LOGGER = logging.getLogger(__name__)
+
+API = "/di/v1/products/1/"
+ALARM_SLOTS = 16
+
+LIGHT_THEMES = ["sunny day", "island red", "nordic white", "", "", ""]
+DUSK_LIGHT_THEMES = ["sunny day", "island red", "nordic white"]
+WAKE_SOUNDS = [
+    "forest birds",
+    "summer birds",
+    "buddha wakeup",
+    "morning alps",
+    "yoga harmony",
+    "nepal bowls",
+    "summer lake",
+    "ocean waves",
+]
+DUSK_SOUNDS = ["soft rain", "ocean waves", "under water", "summer lake"]
+
+DESCRIPTION_XML = """<?xml version="1.0"?>
+<root xmlns="urn:schemas-upnp-org:device-1-0">
+<specVersion><major>1</major><minor>0</minor></specVersion>
+<device>
+<deviceType>urn:philips-com:device:DiProduct:1</deviceType>
+<friendlyName>Fake Somneo</friendlyName>
+<manufacturer>Royal Philips Electronics</manufacturer>
+<modelName>Wake-up Light</modelName>
+<modelNumber>HF367x</modelNumber>
+<modelURL>http://www.philips.com</modelURL>
+<serialNumber>{serial}</serialNumber>
+<UDN>uuid:{serial}</UDN>
+</device>
+</root>
+"""
+
+
+def _themes(names: list[str]) -> dict[str, dict[str, str]]:
+    """Render a theme file listing."""
+    return {str(idx): {"name": name} for idx, name in enumerate(names)}
+
+
+def default_state() -> dict[str, Any]:
+    """Return the state of a freshly reset device."""
+    return {
+        "wusrd": {"mstmp": 21.3, "msrhu": 45.2, "mslux": 12.0, "mssnd": 34},
+        "wulgt": {
+            "onoff": False,
+            "ltlvl": 12,
+            "ngtlt": False,
+            "tempy": False,
+            "ctype": 0,
+            "wucrv": [],
+        },
+        "wusts": {"wusts": 1, "dspon": True, "brght": 3},
+        "wudsk": {
+            "onoff": False,
+            "durat": 30,
+            "ctype": 0,
+            "curve": 20,
+            "snddv": "dus",
+            "sndch": "1",
+            "sndlv": 12,
+        },
+        "wualm": {"snztm": 9},
+        "aenvs": {
+            "prfen": [False] * ALARM_SLOTS,
+            "prfvs": [idx < 2 for idx in range(ALARM_SLOTS)],
+            "pwrsv": [0] * (3 * ALARM_SLOTS),
+        },
+        "aalms": {
+            "almhr": [7] * ALARM_SLOTS,
+            "almmn": [30] * ALARM_SLOTS,
+            "daynm": [254] * ALARM_SLOTS,
+        },
+        "prfwu": [
+            {"ctype": 0, "curve": 20, "durat": 30, "snddv": "wus", "sndch": "1", "sndlv": 12}
+            for _ in range(ALARM_SLOTS)
+        ],
+        "wuply": {
+            "onoff": False,
+            "sdvol": 12,
+            "snddv": "fmr",
+            "sndch": "1",
+            "sndss": 0,
+            "tempy": False,
+        },
+    }
+
+
+class FakeSomneo:
+    """Stateful emulation of a single Somneo device."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        serial: str | None = None,
+        ssl_context: ssl.SSLContext | None = None,
+    ) -> None:
+        """Initialize the fake device."""
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.offline = False
+        self.serial = serial or f"FAKE{random.randrange(16**8):08X}"
+        self.state = default_state()
+        self.requests: dict[str, int] = {}
+        self._ssl_context = ssl_context
+        self._runner: web.AppRunner | None = None
+
+    @property
+    def address(self) -> str:
+        """Return the host:port to configure in the integration."""
+        return f"{self.host}:{self.port}"
+
+    def reset(self) -> None:
+        """Restore the factory state and clear the request counters."""
+        self.state = default_state()
+        self.requests.clear()
+
+    async def start(self) -> None:
+        """Start serving."""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get("/upnp/description.xml", self._description)
+        app.router.add_route("*", API + "{path:.*}", self._api)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(
+            self._runner,
+            self.host,
+            self.port,
+            ssl_context=self._ssl_context or self_signed_context(),
+        )
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+        _LOGGER.info("Fake Somneo %s listening on %s", self.serial, self.address)
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        """Apply latency, error injection and request accounting."""
+        key = f"{request.method} {request.path.removeprefix(API)}"
+        self.requests[key] = self.requests.get(key, 0) + 1
+        if self.offline:
+            # Behave like an unplugged lamp: never answer.
+            await asyncio.sleep(3600)
+        delay = self.latency + random.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        if self.error_rate and random.random() < self.error_rate:
+            raise web.HTTPInternalServerError
+        return await handler(request)
+
+    async def _description(self, request: web.Request) -> web.Response:
+        """Return the UPnP description."""
+        return web.Response(
+            text=DESCRIPTION_XML.format(serial=self.serial), content_type="text/xml"
+        )
+
+    async def _api(self, request: web.Request) -> web.Response:
+        """Dispatch an API call."""
+        path = request.match_info["path"]
+        if request.method == "GET":
+            body = self._get(path)
+        elif request.method == "PUT":
+            body = self._put(path, await request.json())
+        else:
+            raise web.HTTPMethodNotAllowed(request.method, ["GET", "PUT"])
+        if body is None:
+            raise web.HTTPUnprocessableEntity(text="Invalid URL")
+        return web.json_response(body)
+
+    def _get(self, path: str) -> Any:
+        """Handle a read."""
+        state = self.state
+        if path in ("wusrd", "wulgt", "wusts", "wudsk", "wuply"):
+            return deepcopy(state[path])
+        if path == "wualm":
+            return deepcopy(state["wualm"])
+        if path == "wualm/aenvs":
+            return deepcopy(state["aenvs"])
+        if path == "wualm/aalms":
+            return deepcopy(state["aalms"])
+        if path == "files/lightthemes":
+            return _themes(LIGHT_THEMES)
+        if path == "files/dusklightthemes":
+            return _themes(DUSK_LIGHT_THEMES)
+        if path == "files/wakeup":
+            return _themes(WAKE_SOUNDS)
+        if path == "files/winddowndusk":
+            return _themes(DUSK_SOUNDS)
+        return None
+
+    def _put(self, path: str, payload: dict[str, Any]) -> Any:
+        """Handle a write."""
+        state = self.state
+        if path == "wulgt":
+            state["wulgt"].update(payload)
+            return deepcopy(state["wulgt"])
+        if path == "wudsk":
+            state["wudsk"].update(payload)
+            if "onoff" in payload:
+                state["wusts"]["wusts"] = 776 if payload["onoff"] else 1
+            return deepcopy(state["wudsk"])
+        if path == "wuply":
+            state["wuply"].update(payload)
+            return deepcopy(state["wuply"])
+        if path == "wusts":
+            state["wusts"].update(payload)
+            return deepcopy(state["wusts"])
+        if path == "wualm":
+            state["wualm"].update(payload)
+            return deepcopy(state["wualm"])
+        if path == "wualm/alctr":
+            if payload.get("disms"):
+                state["wusts"]["wusts"] = 1
+            elif payload.get("tapsz"):
+                state["wusts"]["wusts"] = 2321
+            return {}
+        if path == "wualm/prfwu":
+            return self._put_alarm(payload)
+        return None
+
+    def _put_alarm(self, payload: dict[str, Any]) -> Any:
+        """Update a single alarm slot."""
+        slot = int(payload["prfnr"]) - 1
+        if not 0 <= slot < ALARM_SLOTS:
+            return None
+        aenvs, aalms = self.state["aenvs"], self.state["aalms"]
+        for key in ("prfen", "prfvs"):
+            if key in payload:
+                aenvs[key][slot] = bool(payload[key])
+        for key in ("almhr", "almmn", "daynm"):
+            if key in payload:
+                aalms[key][slot] = int(payload[key])
+        for offset, key in enumerate(("pwrsz", "pszhr", "pszmn")):
+            if key in payload:
+                aenvs["pwrsv"][3 * slot + offset] = int(payload[key])
+        details = self.state["prfwu"][slot]
+        for key in details:
+            if key in payload:
+                details[key] = payload[key]
+        return {"prfnr": slot + 1, **details}
+
+
+def self_signed_context() -> ssl.SSLContext:
+    """Create a server TLS context with a throwaway self-signed certificate."""
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "fake-somneo")])
+    now = datetime.datetime.now(datetime.UTC)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=365))
+        .add_extension(
+            x509.SubjectAlternativeName(
+                [x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]
+            ),
+            critical=False,
+        )
+        .sign(key, hashes.SHA256())
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cert_path = Path(tmp) / "cert.pem"
+        key_path = Path(tmp) / "key.pem"
+        cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+        key_path.write_bytes(
+            key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        )
+        context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        context.load_cert_chain(cert_path, key_path)
+    return context
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    """Run one or more fake devices until interrupted."""
+    context = self_signed_context()
+    devices = [
+        FakeSomneo(
+            host=args.host,
+            port=args.port + idx if args.port else 0,
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            ssl_context=context,
+        )
+        for idx in range(args.devices)
+    ]
+    for device in devices:
+        await device.start()
+        print(f"{device.serial} {device.address}", flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        for device in devices:
+            await device.stop()
+
+
+def main() -> None:
+    """Parse the command line and serve."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8443)
+    parser.add_argument("--devices", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="0..1")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_serve(args))
+
+
+if __name__ == "__main__":
+    main()